@@ -919,9 +919,9 @@ def mailer_template_edit(request, pk):
     if request.method == "POST":
         form = MailerTemplateForm(request.POST, instance=template)
         if form.is_valid():
-            updated_template = form.save(commit=False)
-            updated_template.owner = owner
-            updated_template.save()
+            # template was fetched by owner, so the owner is already correct; let the
+            # form save only the edited columns.
+            form.save()
             messages.success(request, "Mailer template updated.")
             return redirect("accounts:mailer_templates")
     else:
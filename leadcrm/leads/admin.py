@@ -1,13 +1,9 @@
 from django.contrib import admin
-from django.db.models import Count, Q
+from django.db.models import BooleanField, Case, Q, When
 from django.utils.html import format_html
-from django.urls import reverse
-from django.contrib.auth import get_user_model
 
 from .models import Lead, SavedParcelList, LienRecord, LegalAction, LienSearchAttempt, SkipTraceRecord, AttomData
 
-User = get_user_model()
-
 
 @admin.register(Lead)
 class LeadAdmin(admin.ModelAdmin):
@@ -153,12 +149,28 @@ class AttomDataAdmin(admin.ModelAdmin):
         return format_html('<span style="color: gray;">—</span>')
     has_mortgage.short_description = "Mortgage"
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        # Resolve the foreclosure flag in SQL so list rendering reads one boolean
+        return qs.annotate(
+            _fc=Case(
+                When(pre_foreclosure=True, then=True),
+                When(Q(foreclosure_stage__isnull=False) & ~Q(foreclosure_stage=""), then=True),
+                default=False,
+                output_field=BooleanField(),
+            )
+        )
+
     def has_foreclosure(self, obj):
         """Display foreclosure status"""
-        if obj.pre_foreclosure or obj.foreclosure_stage:
+        flagged = getattr(obj, "_fc", None)
+        if flagged is None:
+            flagged = bool(obj.pre_foreclosure or obj.foreclosure_stage)
+        if flagged:
             return format_html('<span style="color: red;">⚠ {}</span>', obj.foreclosure_stage or "Yes")
         return format_html('<span style="color: gray;">—</span>')
     has_foreclosure.short_description = "Foreclosure"
+    has_foreclosure.admin_order_field = "_fc"
 
     fieldsets = (
         ("Property Information", {
@@ -0,0 +1,140 @@
+"""
+ATTOM response inspection helpers shared by `manage.py test_attom` and its Celery task.
+"""
+import os
+import traceback
+
+import orjson
+
+from .attom_service import fetch_attom_data_for_address
+from .services import get_massgis_parcel_detail
+
+# Property sections whose contents are reported in detail, in report order.
+ATTOM_DETAIL_SECTIONS = ("foreclosure", "mortgage", "assessment", "tax")
+
+
+def _dumps_response(raw, compact: bool = False) -> bytes:
+    """Encode an ATTOM response as JSON bytes.
+
+    Output is indented for reading unless ``compact`` is set.
+    """
+    if compact:
+        return orjson.dumps(raw, default=str)
+    return orjson.dumps(raw, default=str, option=orjson.OPT_INDENT_2)
+
+
+def _write_bytes(path: str, payload: bytes) -> None:
+    """Write ``payload`` straight to a file descriptor, bypassing Python's buffered file layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _section_summary(value) -> dict:
+    """``{"items": [[key, value], ...]}`` for a mapping, else its type and value as text."""
+    try:
+        return {"items": [[key, item] for key, item in sorted(value.items())]}
+    except AttributeError:
+        return {"type": str(type(value)), "value": str(value)}
+
+
+def summarize_attom_response(raw: dict) -> dict:
+    """
+    Reduce a raw ATTOM response to the structure test_attom reports.
+
+    Keeps the status message, property count, the first property's keys and types, and
+    the detail sections (only the first mortgage), rather than the whole payload.
+    """
+    properties = raw.get("property") or []
+    summary = {
+        "status": raw.get("status", {}).get("msg", "N/A"),
+        "property_count": len(properties),
+        "property_keys": [],
+        "sections": {},
+    }
+    if not properties:
+        return summary
+
+    prop = properties[0]
+    summary["property_keys"] = [[key, type(value).__name__] for key, value in sorted(prop.items())]
+    for key in ATTOM_DETAIL_SECTIONS:
+        if key not in prop:
+            continue
+        value = prop[key]
+        if key == "mortgage":
+            if isinstance(value, list):
+                section = {"count": len(value)}
+                if value:
+                    section["first"] = _section_summary(value[0])
+            else:
+                section = {"type": str(type(value))}
+        else:
+            section = _section_summary(value)
+        summary["sections"][key] = section
+    return summary
+
+
+def inspect_parcel(town_id: int, loc_id: str, compact: bool = False) -> dict:
+    """
+    Fetch ATTOM data for one parcel and save the raw response to /tmp.
+
+    Returns a JSON-serializable summary (parcel address, ATTOM addresses, response
+    structure, output file, error) so the same function can run in-process or as a
+    Celery task; the raw response itself only goes to the output file. Errors are
+    recorded in the summary instead of being raised.
+    """
+    result = {
+        "town_id": town_id,
+        "loc_id": loc_id,
+        "parcel": None,
+        "address1": None,
+        "address2": None,
+        "response": None,
+        "output_file": None,
+        "error": None,
+        "traceback": None,
+    }
+
+    try:
+        # Get parcel details from MassGIS
+        parcel = get_massgis_parcel_detail(town_id, loc_id)
+        result["parcel"] = {
+            "site_address": parcel.site_address,
+            "site_city": parcel.site_city,
+            "site_zip": parcel.site_zip,
+        }
+
+        if not parcel.site_address or not parcel.site_city:
+            result["error"] = "Parcel is missing address information"
+            return result
+
+        # Construct address for ATTOM
+        address1 = parcel.site_address
+        address2 = f"{parcel.site_city}, {parcel.site_zip}" if parcel.site_zip else parcel.site_city
+        result["address1"] = address1
+        result["address2"] = address2
+
+        # Fetch from ATTOM
+        attom_data = fetch_attom_data_for_address(address1, address2)
+        if not attom_data or not attom_data.get("raw_response"):
+            return result
+
+        raw = attom_data.get("raw_response", {})
+        result["response"] = summarize_attom_response(raw)
+
+        if raw.get('property'):
+            # Save full JSON to file for inspection
+            output_file = f"/tmp/attom_response_{town_id}_{loc_id}.json"
+            _write_bytes(output_file, _dumps_response(raw, compact=compact))
+            result["output_file"] = output_file
+
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+
+    return result
@@ -1,16 +1,139 @@
 
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import attrgetter
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional
 from decimal import Decimal, InvalidOperation
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import connection
+from django.db.models import Q
+from django.dispatch import receiver
 from .models import AttomData, SavedParcelList
 from .services import get_massgis_parcel_detail, _normalize_loc_id
 
+logger = logging.getLogger(__name__)
+
+
+ATTOM_BASE_URL = "https://api.gateway.attomdata.com/propertyapi/v1.0.0"
+
+# Error bodies are only inspected for ATTOM's status block, which sits at the start.
+ERROR_BODY_LIMIT = 4096
+_SUCCESS_WITHOUT_RESULT_RE = re.compile(rb'"msg"\s*:\s*"SuccessWithoutResult"')
+
+
+# Unit designators stripped from address1 when retrying a failed lookup.
+_UNIT_HASH_RE = re.compile(r'\s*#.*$')
+_UNIT_WORD_RE = re.compile(r'\s*(?:Unit|Apt|Suite|Ste)\s+.*$', re.IGNORECASE)
+
+# ATTOM settings are read on every lookup; resolve them once and drop the cached
+# values when a test overrides them.
+@lru_cache(maxsize=None)
+def _api_key() -> Optional[str]:
+    return getattr(settings, "ATTOM_API_KEY", None)
+
+
+@lru_cache(maxsize=None)
+def _cache_max_age_days() -> int:
+    return getattr(settings, "ATTOM_CACHE_MAX_AGE_DAYS", 60)
+
+
+@lru_cache(maxsize=None)
+def _miss_max_age_days() -> int:
+    return getattr(settings, "ATTOM_MISS_MAX_AGE_DAYS", 180)
+
+
+@lru_cache(maxsize=None)
+def _default_state() -> str:
+    return getattr(settings, "ATTOM_DEFAULT_STATE", "MA")
+
+
+_CACHED_SETTINGS = {
+    "ATTOM_API_KEY": _api_key,
+    "ATTOM_CACHE_MAX_AGE_DAYS": _cache_max_age_days,
+    "ATTOM_MISS_MAX_AGE_DAYS": _miss_max_age_days,
+    "ATTOM_DEFAULT_STATE": _default_state,
+}
+
+
+@receiver(setting_changed)
+def _clear_cached_setting(*, setting, **kwargs):
+    cached = _CACHED_SETTINGS.get(setting)
+    if cached is not None:
+        cached.cache_clear()
+
+_ATTOM_SESSION: Optional[requests.Session] = None
+_ATTOM_SESSION_LOCK = threading.Lock()
+
+
+def _get_attom_session(api_key: str) -> requests.Session:
+    """
+    Return the shared ATTOM session, creating it on first use.
+
+    Batch enrichment calls the API once per parcel, so keeping pooled keep-alive
+    connections avoids a TCP/TLS handshake on every request.
+    """
+    global _ATTOM_SESSION
+    session = _ATTOM_SESSION
+    if session is None or session.headers.get("apikey") != api_key:
+        with _ATTOM_SESSION_LOCK:
+            session = _ATTOM_SESSION
+            if session is None or session.headers.get("apikey") != api_key:
+                session = requests.Session()
+                retries = Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    # Hand the final response back so raise_for_status() reports it as before.
+                    raise_on_status=False,
+                )
+                session.mount(
+                    "https://",
+                    HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries),
+                )
+                session.headers.update({
+                    "apikey": api_key,
+                    "accept": "application/json",
+                })
+                _ATTOM_SESSION = session
+    return session
+
+
+# Unit lookups and cache-key building normalize the same LOC_IDs over and over while
+# enriching a list, so memoize the (pure) normalization.
+_norm_loc_id = lru_cache(maxsize=100_000)(_normalize_loc_id)
+
+def _decode_json_response(response) -> dict:
+    """Decode an ATTOM JSON body straight from the raw bytes."""
+    return orjson.loads(response.content)
+
+
+def _loads_json(body: bytes):
+    """Parse a JSON byte string."""
+    return orjson.loads(body)
+
 
 def _safe_decimal(value, default=None):
     """Safely convert a value to Decimal, returning default if conversion fails."""
     if value is None:
         return default
+    # ATTOM payloads are mostly already numeric; skip the str() round-trip for those.
+    value_type = type(value)
+    if value_type is Decimal:
+        return value
+    if value_type is int:
+        return Decimal(value)
+    if value_type is float:
+        return Decimal(repr(value))
     try:
         return Decimal(str(value))
     except (InvalidOperation, ValueError, TypeError):
@@ -21,33 +144,27 @@ def _safe_int(value, default=None):
     """Safely convert a value to int, returning default if conversion fails."""
     if value is None:
         return default
+    if type(value) is int:
+        return value
     try:
         return int(value)
     except (ValueError, TypeError):
         return default
 
 
-def _extract_foreclosure_details(property_data: dict) -> dict:
-    """Extract detailed foreclosure information from ATTOM API response."""
-    foreclosure_data = property_data.get("foreclosure", {})
+def _first(data: dict, *keys):
+    """Return the first truthy value among `keys`, or the last lookup result (same as an `or` chain)."""
+    value = None
+    for key in keys:
+        value = data.get(key)
+        if value:
+            return value
+    return value
 
-    details = {
-        "foreclosure_recording_date": foreclosure_data.get("recordingDate"),
-        "foreclosure_auction_date": foreclosure_data.get("auctionDate"),
-        "foreclosure_estimated_value": _safe_decimal(foreclosure_data.get("estimatedValue")),
-        "foreclosure_judgment_amount": _safe_decimal(foreclosure_data.get("judgmentAmount")),
-        "foreclosure_default_amount": _safe_decimal(foreclosure_data.get("defaultAmount")),
-        "foreclosure_stage": foreclosure_data.get("stage") or foreclosure_data.get("foreclosureStatus"),
-        "foreclosure_document_type": foreclosure_data.get("documentType"),
-    }
-
-    return details
 
-
-def _extract_mortgage_details(property_data: dict) -> dict:
-    """Extract detailed mortgage information from ATTOM API response."""
+def _mortgage_section(property_data: dict, assessment: dict) -> dict:
+    """Locate the primary mortgage record inside an ATTOM property."""
     # Try to get mortgage from assessment section first (expandedprofile endpoint)
-    assessment = property_data.get("assessment", {})
     mortgage_raw = assessment.get("mortgage", {})
 
     # If not in assessment, try direct mortgage field (other endpoints)
@@ -56,29 +173,44 @@ def _extract_mortgage_details(property_data: dict) -> dict:
 
     # Handle both dict and list formats
     if isinstance(mortgage_raw, list):
-        mortgage_data = mortgage_raw[0] if mortgage_raw else {}
-    elif isinstance(mortgage_raw, dict):
+        return mortgage_raw[0] if mortgage_raw else {}
+    if isinstance(mortgage_raw, dict):
         # For expandedprofile, mortgage data is in FirstConcurrent
         if "FirstConcurrent" in mortgage_raw:
-            mortgage_data = mortgage_raw.get("FirstConcurrent", {})
-        else:
-            mortgage_data = mortgage_raw
-    else:
-        mortgage_data = {}
+            return mortgage_raw.get("FirstConcurrent", {})
+        return mortgage_raw
+    return {}
 
-    # Extract lender name from nested structure
-    lender_info = mortgage_data.get("lender", {})
+
+def _extract_all(property_data: dict, details: Optional[dict] = None) -> dict:
+    """
+    Extract mortgage, tax, foreclosure, and propensity details from one ATTOM property.
+
+    Each section of `property_data` is looked up once and every field is written into
+    `details` (a new dict when omitted), along with any default flags (tax_default,
+    pre_foreclosure, mortgage_default) the property implies. Foreclosure fields are only
+    present when ATTOM reports a foreclosure summary.
+    """
+    assessment = property_data.get("assessment") or {}
+    mortgage_data = _mortgage_section(property_data, assessment)
+    tax_data = assessment.get("tax") or property_data.get("tax") or {}
+    foreclosure_data = property_data.get("foreclosure") or {}
+    propensity_data = property_data.get("propensity") or property_data.get("propensityToDefault") or {}
+
+    if details is None:
+        details = {}
+
+    # Mortgage
+    get = mortgage_data.get
+    lender_info = get("lender", {})
     lender_name = (
-        lender_info.get("lastname") or
-        lender_info.get("companyname") or
-        mortgage_data.get("lenderName") or
-        mortgage_data.get("lenderNameBeneficiary") or
-        mortgage_data.get("lenderLastName")  # expandedprofile format
+        _first(lender_info, "lastname", "companyname") or
+        _first(mortgage_data, "lenderName", "lenderNameBeneficiary", "lenderLastName")  # last is expandedprofile format
     )
 
     # Extract term and convert to years if needed
     # ATTOM may return term in months (e.g., 360) or years (e.g., 30)
-    term_raw = mortgage_data.get("termYears") or mortgage_data.get("term")
+    term_raw = get("termYears") or get("term")
     term_years = None
     if term_raw is not None:
         term_int = _safe_int(term_raw)
@@ -89,75 +221,99 @@ def _extract_mortgage_details(property_data: dict) -> dict:
             else:
                 term_years = term_int
 
-    details = {
-        "mortgage_loan_amount": _safe_decimal(mortgage_data.get("amount")),
-        "mortgage_loan_type": mortgage_data.get("loantypecode") or mortgage_data.get("loanTypeCode") or mortgage_data.get("loanType") or mortgage_data.get("mortgageType"),
-        "mortgage_lender_name": lender_name,
-        "mortgage_interest_rate": _safe_decimal(mortgage_data.get("interestRate") or mortgage_data.get("interestrate")),
-        "mortgage_term_years": term_years,
-        "mortgage_recording_date": mortgage_data.get("date") or mortgage_data.get("recordingDate"),
-        "mortgage_due_date": mortgage_data.get("duedate") or mortgage_data.get("dueDate") or mortgage_data.get("maturityDate"),
-        "mortgage_loan_number": mortgage_data.get("loanNumber") or mortgage_data.get("trustDeedDocumentNumber"),
-    }
-
-    return details
-
-
-def _extract_tax_details(property_data: dict) -> dict:
-    """Extract detailed tax information from ATTOM API response."""
-    # Tax info can be in different places depending on the endpoint
-    assessment_data = property_data.get("assessment", {})
-    tax_data = assessment_data.get("tax", {}) or property_data.get("tax", {})
-
-    # Get assessed value from nested structure
-    assessed_info = assessment_data.get("assessed", {})
-    assessed_value = (
-        _safe_decimal(assessed_info.get("assdTtlValue")) or  # expandedprofile format
-        _safe_decimal(assessed_info.get("assdttlvalue")) or
-        _safe_decimal(assessment_data.get("assessedValue")) or
-        _safe_decimal(tax_data.get("assessedValue"))
+    details["mortgage_loan_amount"] = _safe_decimal(get("amount"))
+    details["mortgage_loan_type"] = _first(mortgage_data, "loantypecode", "loanTypeCode", "loanType", "mortgageType")
+    details["mortgage_lender_name"] = lender_name
+    details["mortgage_interest_rate"] = _safe_decimal(get("interestRate") or get("interestrate"))
+    details["mortgage_term_years"] = term_years
+    details["mortgage_recording_date"] = get("date") or get("recordingDate")
+    details["mortgage_due_date"] = _first(mortgage_data, "duedate", "dueDate", "maturityDate")
+    details["mortgage_loan_number"] = get("loanNumber") or get("trustDeedDocumentNumber")
+
+    # Tax and assessment
+    tax_get = tax_data.get
+    assessed_get = assessment.get("assessed", {}).get
+    details["tax_assessment_year"] = (
+        _safe_int(tax_get("taxYear")) or  # expandedprofile format
+        _safe_int(tax_get("taxyear")) or
+        _safe_int(assessment.get("year"))
     )
-
-    # Get tax year and amount
-    tax_year = (
-        _safe_int(tax_data.get("taxYear")) or  # expandedprofile format
-        _safe_int(tax_data.get("taxyear")) or
-        _safe_int(assessment_data.get("year"))
+    details["tax_assessed_value"] = (
+        _safe_decimal(assessed_get("assdTtlValue")) or  # expandedprofile format
+        _safe_decimal(assessed_get("assdttlvalue")) or
+        _safe_decimal(assessment.get("assessedValue")) or
+        _safe_decimal(tax_get("assessedValue"))
     )
-
-    tax_amount = (
-        _safe_decimal(tax_data.get("taxAmt")) or  # expandedprofile format
-        _safe_decimal(tax_data.get("taxamt")) or
-        _safe_decimal(tax_data.get("annualTaxAmount"))
+    details["tax_amount_annual"] = (
+        _safe_decimal(tax_get("taxAmt")) or  # expandedprofile format
+        _safe_decimal(tax_get("taxamt")) or
+        _safe_decimal(tax_get("annualTaxAmount"))
     )
+    details["tax_delinquent_year"] = _safe_int(tax_get("delinquentYear") or tax_get("delinquent_year"))
+
+    # Check for tax delinquency
+    if details["tax_delinquent_year"]:
+        details["tax_default"] = True
+
+    # Check for foreclosure flags in property data
+    foreclosure_summary = foreclosure_data.get("summary")
+    if foreclosure_summary:
+        details["pre_foreclosure"] = True
+        summary_text = str(foreclosure_summary).lower()
+        if "tax" in summary_text:
+            details["tax_default"] = True
+        if "mortgage" in summary_text:
+            details["mortgage_default"] = True
+
+        get = foreclosure_data.get
+        details["foreclosure_recording_date"] = get("recordingDate")
+        details["foreclosure_auction_date"] = get("auctionDate")
+        details["foreclosure_estimated_value"] = _safe_decimal(get("estimatedValue"))
+        details["foreclosure_judgment_amount"] = _safe_decimal(get("judgmentAmount"))
+        details["foreclosure_default_amount"] = _safe_decimal(get("defaultAmount"))
+        details["foreclosure_stage"] = get("stage") or get("foreclosureStatus")
+        details["foreclosure_document_type"] = get("documentType")
 
-    details = {
-        "tax_assessment_year": tax_year,
-        "tax_assessed_value": assessed_value,
-        "tax_amount_annual": tax_amount,
-        "tax_delinquent_year": _safe_int(tax_data.get("delinquentYear") or tax_data.get("delinquent_year")),
-    }
+    # Propensity score might be in different locations
+    get = propensity_data.get
+    details["propensity_to_default_score"] = _safe_int(get("score") or get("propensityScore"))
+    details["propensity_to_default_decile"] = _safe_int(get("decile") or get("propensityDecile"))
 
     return details
 
 
-def _extract_propensity_score(property_data: dict) -> dict:
-    """Extract propensity to default score from ATTOM API response."""
-    # Propensity score might be in different locations
-    propensity_data = property_data.get("propensity", {}) or property_data.get("propensityToDefault", {})
+# Outcomes reported by _fetch_from_attom_endpoint alongside the response body.
+FETCH_OK = "ok"
+FETCH_NOT_FOUND = "not_found"      # ATTOM answered SuccessWithoutResult / no property
+FETCH_BAD_REQUEST = "bad_request"  # any other 400; the address variant was rejected
+FETCH_ERROR = "error"              # server/network failure after retries, or no API key
 
-    score = propensity_data.get("score") or propensity_data.get("propensityScore")
-    decile = propensity_data.get("decile") or propensity_data.get("propensityDecile")
+# Process-local record of lookups ATTOM definitively answered with "no property", so
+# re-enriching the same addresses does not repeat known misses.
+_MISS_CACHE_SIZE = 10_000
+_miss_cache: "OrderedDict[tuple, bool]" = OrderedDict()
+_miss_cache_lock = threading.Lock()
 
-    details = {
-        "propensity_to_default_score": _safe_int(score),
-        "propensity_to_default_decile": _safe_int(decile),
-    }
 
-    return details
+def _remember_miss(key: tuple) -> None:
+    with _miss_cache_lock:
+        _miss_cache[key] = True
+        _miss_cache.move_to_end(key)
+        if len(_miss_cache) > _MISS_CACHE_SIZE:
+            _miss_cache.popitem(last=False)
 
 
-def _fetch_from_attom_endpoint(endpoint: str, address1: str, address2: str, extra_params: Optional[dict] = None) -> dict:
+def _is_known_miss(key: tuple) -> bool:
+    with _miss_cache_lock:
+        if key in _miss_cache:
+            _miss_cache.move_to_end(key)
+            return True
+    return False
+
+
+def _fetch_from_attom_endpoint(
+    endpoint: str, address1: str, address2: str, extra_params: Optional[dict] = None
+) -> tuple[dict, str]:
     """
     Helper to fetch data from a specific ATTOM endpoint.
 
@@ -167,66 +323,78 @@ def _fetch_from_attom_endpoint(endpoint: str, address1: str, address2: str, extr
         address2: City, state, zip
 
     Returns:
-        Raw API response dict or empty dict on error
+        Tuple of (raw API response dict or empty dict, one of the FETCH_* outcomes)
     """
-    api_key = settings.ATTOM_API_KEY
+    api_key = _api_key()
     if not api_key:
-        print(f"ATTOM_API_KEY not found in settings.")
-        return {}
+        logger.warning("ATTOM_API_KEY not found in settings.")
+        return {}, FETCH_ERROR
 
-    url = f"https://api.gateway.attomdata.com/propertyapi/v1.0.0{endpoint}"
+    url = ATTOM_BASE_URL + endpoint
+    session = _get_attom_session(api_key)
 
-    headers = {
-        "apikey": api_key,
-        "accept": "application/json",
-    }
-    params = {
-        "address1": address1,
-        "address2": address2,
-    }
+    params = {"address1": address1, "address2": address2}
     if extra_params:
-        for key, value in extra_params.items():
-            if value:
-                params[key] = value
+        params.update({key: value for key, value in extra_params.items() if value})
+
+    miss_key = (endpoint, *sorted(params.items()))
+    if _is_known_miss(miss_key):
+        logger.debug("Skipping known ATTOM miss: %s, %s", params.get("address1"), params.get("address2"))
+        return {}, FETCH_NOT_FOUND
 
     try:
-        print(f"[ATTOM DEBUG] Making request to: {url}")
-        print(f"[ATTOM DEBUG] Params: {params}")
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        print(f"[ATTOM DEBUG] Response status: {response.status_code}")
-        response.raise_for_status()
-        data = response.json()
+        logger.debug("ATTOM request: %s params=%s", url, params)
+        # Stream so error responses are never read past the few KB we inspect.
+        with session.get(url, params=params, timeout=30, stream=True) as response:
+            logger.debug("ATTOM response status: %s", response.status_code)
+            # 400 errors typically mean the address isn't in ATTOM's database
+            if response.status_code == 400:
+                body = next(response.iter_content(chunk_size=ERROR_BODY_LIMIT), b"")[:ERROR_BODY_LIMIT]
+                try:
+                    error_data = _loads_json(body)
+                    status = error_data.get("status") if isinstance(error_data, dict) else None
+                    not_found = isinstance(status, dict) and status.get("msg") == "SuccessWithoutResult"
+                except ValueError:
+                    # Truncated or non-JSON body; the status block leads ATTOM's payloads.
+                    not_found = _SUCCESS_WITHOUT_RESULT_RE.search(body) is not None
+                if not_found:
+                    logger.debug(
+                        "Property not found in ATTOM database (SuccessWithoutResult): %s, %s",
+                        params.get("address1"),
+                        params.get("address2"),
+                    )
+                    _remember_miss(miss_key)
+                    reason = FETCH_NOT_FOUND
+                else:
+                    logger.debug("ATTOM 400 response body: %s", body[:500].decode("utf-8", "replace"))
+                    reason = FETCH_BAD_REQUEST
+                logger.debug("Address not found in ATTOM database for %s", endpoint)
+                return {}, reason
+
+            response.raise_for_status()
+            data = _decode_json_response(response)
 
         # Check if ATTOM returned "SuccessWithoutResult" (valid request but no data)
         status = data.get("status", {})
         if status.get("msg") == "SuccessWithoutResult":
-            print(f"[ATTOM DEBUG] ATTOM returned SuccessWithoutResult - property not in their database")
-            print(f"[ATTOM DEBUG] Requested: {params.get('address1')}, {params.get('address2')}")
-            return {}
+            logger.debug(
+                "ATTOM returned SuccessWithoutResult for %s, %s", params.get("address1"), params.get("address2")
+            )
+            _remember_miss(miss_key)
+            return {}, FETCH_NOT_FOUND
 
-        return data
+        if not data.get("property"):
+            return data, FETCH_NOT_FOUND
+        return data, FETCH_OK
     except requests.exceptions.HTTPError as e:
-        # 400 errors typically mean the address isn't in ATTOM's database
-        if e.response.status_code == 400:
-            try:
-                error_data = e.response.json()
-                if error_data.get("status", {}).get("msg") == "SuccessWithoutResult":
-                    print(f"[ATTOM DEBUG] Property not found in ATTOM database (SuccessWithoutResult)")
-                    print(f"[ATTOM DEBUG] Requested: {params.get('address1')}, {params.get('address2')}")
-                else:
-                    print(f"[ATTOM DEBUG] 400 Error - Response body: {e.response.text[:500]}")
-            except:
-                print(f"[ATTOM DEBUG] 400 Error - Response body: {e.response.text[:500]}")
-            print(f"Address not found in ATTOM database for {endpoint}")
-        else:
-            print(f"HTTP error fetching from {endpoint}: {e}")
-        return {}
+        logger.warning("HTTP error fetching from %s: %s", endpoint, e)
+        return {}, FETCH_ERROR
     except requests.exceptions.RequestException as e:
-        print(f"Error fetching from {endpoint}: {e}")
-        return {}
+        logger.warning("Error fetching from %s: %s", endpoint, e)
+        return {}, FETCH_ERROR
     except Exception as e:
-        print(f"Unexpected error fetching from {endpoint}: {type(e).__name__}: {e}")
-        return {}
+        logger.exception("Unexpected error fetching from %s: %s: %s", endpoint, type(e).__name__, e)
+        return {}, FETCH_ERROR
 
 
 def fetch_attom_data_for_address(address1: str, address2: str, owner_name: Optional[str] = None) -> dict:
@@ -241,10 +409,17 @@ def fetch_attom_data_for_address(address1: str, address2: str, owner_name: Optio
     Returns:
         Dictionary containing all ATTOM data fields
     """
-    api_key = settings.ATTOM_API_KEY
+    return _fetch_attom_data_for_address(address1, address2, owner_name)[0]
+
+
+def _fetch_attom_data_for_address(
+    address1: str, address2: str, owner_name: Optional[str] = None
+) -> tuple[dict, str]:
+    """fetch_attom_data_for_address, also returning the FETCH_* outcome of the last lookup."""
+    api_key = _api_key()
     if not api_key:
-        print("ATTOM_API_KEY not found in settings.")
-        return {}
+        logger.warning("ATTOM_API_KEY not found in settings.")
+        return {}, FETCH_ERROR
 
     # Clean up addresses - remove extra whitespace that causes 400 errors
     address1 = " ".join(address1.split()) if address1 else ""
@@ -254,10 +429,9 @@ def fetch_attom_data_for_address(address1: str, address2: str, owner_name: Optio
     if owner_name:
         owner_param = " ".join(str(owner_name).split())
 
-    print(f"[ATTOM DEBUG] Fetching comprehensive ATTOM data")
-    print(f"[ATTOM DEBUG] Address1: '{address1}'")
-    print(f"[ATTOM DEBUG] Address2: '{address2}'")
-    print(f"[ATTOM DEBUG] Owner: '{owner_param}'" if owner_param else "[ATTOM DEBUG] Owner: None")
+    logger.debug(
+        "Fetching comprehensive ATTOM data: address1=%r address2=%r owner=%r", address1, address2, owner_param
+    )
 
     # Initialize result structure
     result = {
@@ -268,24 +442,25 @@ def fetch_attom_data_for_address(address1: str, address2: str, owner_name: Optio
     }
 
     # Fetch all data from /property/expandedprofile (includes mortgage, assessment, tax data)
-    print("  → Fetching property data from expandedprofile endpoint...")
 
     # Try with owner name first if provided
     profile_response = {}
+    reason = FETCH_NOT_FOUND
     if owner_param:
-        print(f"  → Trying with owner name: {owner_param}")
-        profile_response = _fetch_from_attom_endpoint(
+        logger.debug("Trying ATTOM expandedprofile with owner name: %s", owner_param)
+        profile_response, reason = _fetch_from_attom_endpoint(
             "/property/expandedprofile",
             address1,
             address2,
             extra_params={"ownername": owner_param},
         )
 
-    # If no results with owner name or owner not provided, try without it
-    if not profile_response or not profile_response.get("property"):
+    # If no results with owner name or owner not provided, try without it. A server or
+    # network failure (already retried by the session) would not be fixed by a variant.
+    if reason in (FETCH_NOT_FOUND, FETCH_BAD_REQUEST):
         if owner_param:
-            print("  → Owner name lookup failed, retrying without owner name parameter...")
-        profile_response = _fetch_from_attom_endpoint(
+            logger.debug("Owner name lookup failed, retrying without owner name parameter")
+        profile_response, reason = _fetch_from_attom_endpoint(
             "/property/expandedprofile",
             address1,
             address2,
@@ -293,17 +468,16 @@ def fetch_attom_data_for_address(address1: str, address2: str, owner_name: Optio
         )
 
     # If still no results, try normalizing the address (remove unit numbers, try common abbreviations)
-    if not profile_response or not profile_response.get("property"):
-        print("  → Initial lookup failed, trying address variations...")
+    if reason in (FETCH_NOT_FOUND, FETCH_BAD_REQUEST):
+        logger.debug("Initial ATTOM lookup failed, trying address variations")
 
         # Try removing unit/apartment numbers from address
-        import re
-        address1_base = re.sub(r'\s*#.*$', '', address1)  # Remove # and everything after
-        address1_base = re.sub(r'\s*(Unit|Apt|Suite|Ste)\s+.*$', '', address1_base, flags=re.IGNORECASE)
+        address1_base = _UNIT_HASH_RE.sub('', address1)  # Remove # and everything after
+        address1_base = _UNIT_WORD_RE.sub('', address1_base)
 
         if address1_base != address1:
-            print(f"  → Trying without unit number: {address1_base}")
-            profile_response = _fetch_from_attom_endpoint(
+            logger.debug("Trying ATTOM lookup without unit number: %s", address1_base)
+            profile_response, reason = _fetch_from_attom_endpoint(
                 "/property/expandedprofile",
                 address1_base,
                 address2,
@@ -319,24 +493,13 @@ def fetch_attom_data_for_address(address1: str, address2: str, owner_name: Optio
             property_data = properties[0]
         else:
             # Multiple records found - select the one with the most recent mortgage date
-            print(f"  ℹ️  Found {len(properties)} property records, selecting most recent mortgage...")
+            logger.debug("Found %d ATTOM property records, selecting most recent mortgage", len(properties))
             most_recent_date = None
             most_recent_property = properties[0]  # Fallback to first
 
             for prop in properties:
                 # Try to extract mortgage date from this property
-                assessment = prop.get("assessment", {})
-                mortgage_raw = assessment.get("mortgage", {})
-                if not mortgage_raw:
-                    mortgage_raw = prop.get("mortgage", {})
-
-                # Handle both dict and list formats
-                if isinstance(mortgage_raw, list):
-                    mortgage_data = mortgage_raw[0] if mortgage_raw else {}
-                elif isinstance(mortgage_raw, dict):
-                    mortgage_data = mortgage_raw.get("FirstConcurrent", {}) if "FirstConcurrent" in mortgage_raw else mortgage_raw
-                else:
-                    mortgage_data = {}
+                mortgage_data = _mortgage_section(prop, prop.get("assessment") or {})
 
                 recording_date_str = mortgage_data.get("date") or mortgage_data.get("recordingDate")
                 if recording_date_str:
@@ -351,72 +514,144 @@ def fetch_attom_data_for_address(address1: str, address2: str, owner_name: Optio
 
             property_data = most_recent_property
             if most_recent_date:
-                print(f"  ✓ Selected property with mortgage date: {most_recent_date.strftime('%Y-%m-%d')}")
+                logger.debug("Selected ATTOM property with mortgage date: %s", most_recent_date.date())
 
-        # Extract mortgage details
-        mortgage_details = _extract_mortgage_details(property_data)
-        result.update(mortgage_details)
-
-        # Extract tax and assessment details
-        tax_details = _extract_tax_details(property_data)
-        result.update(tax_details)
+        _extract_all(property_data, result)
 
         # Store raw response
         result["raw_response"]["expandedprofile"] = profile_response
 
-        # Check for tax delinquency
-        if tax_details.get("tax_delinquent_year"):
-            result["tax_default"] = True
+        logger.info("Fetched ATTOM property data for %s, %s", address1, address2)
+    else:
+        # ATTOM coverage varies by location and property type, so misses are expected.
+        logger.info("No ATTOM property data returned for %s, %s", address1, address2)
+
+    return result, reason
 
-        # Check for foreclosure flags in property data
-        foreclosure_summary = property_data.get("foreclosure", {}).get("summary")
-        if foreclosure_summary:
-            result["pre_foreclosure"] = True
-            if "tax" in str(foreclosure_summary).lower():
-                result["tax_default"] = True
-            if "mortgage" in str(foreclosure_summary).lower():
-                result["mortgage_default"] = True
 
-            # Extract foreclosure details if present
-            foreclosure_details = _extract_foreclosure_details(property_data)
-            result.update(foreclosure_details)
+_UNIT_KEY_NAMES = ("row_key", "source_id", "id", "unit_number")
 
-        # Try to extract propensity score if available
-        propensity_details = _extract_propensity_score(property_data)
-        result.update(propensity_details)
 
-        print(f"  ✓ Successfully fetched property data from ATTOM")
-    else:
-        print(f"  ✗ No data returned from ATTOM endpoint")
-        print(f"  ℹ️  This property may not be in ATTOM's database. This is normal for some properties.")
-        print(f"  ℹ️  ATTOM coverage varies by location and property type.")
+def _unit_indexes(parcel) -> tuple[dict, dict]:
+    """
+    Return ({normalized unit loc_id: unit}, {lowercased row/source key: unit}) for a parcel.
+
+    Built in one pass over units_detail and kept on the parcel object, so resolving several
+    units of the same parcel is a dict probe each. The first unit wins on duplicate keys,
+    matching the order a linear scan would find them in; the indexes are rebuilt if
+    units_detail is replaced.
+    """
+    # () is a singleton, so parcels without units also hit the cached indexes.
+    units = parcel.units_detail or ()
+    cached = getattr(parcel, "_attom_unit_indexes", None)
+    if cached is not None and cached[0] is units:
+        return cached[1], cached[2]
+
+    loc_index: dict = {}
+    key_index: dict = {}
+    for unit in units:
+        unit_loc = unit.get("loc_id")
+        if unit_loc:
+            loc_index.setdefault(_norm_loc_id(unit_loc), unit)
+        for key_name in _UNIT_KEY_NAMES:
+            value = unit.get(key_name)
+            if value:
+                key_index.setdefault(str(value).strip().lower(), unit)
 
-    return result
+    try:
+        parcel._attom_unit_indexes = (units, loc_index, key_index)
+    except AttributeError:  # pragma: no cover - read-only parcel objects just skip the cache
+        pass
+    return loc_index, key_index
 
 
 def _find_unit_for_loc(parcel, loc_id: str, unit_key: Optional[str] = None) -> Optional[dict]:
     """
     Attempt to locate a specific unit within a parcel by loc_id or row/source key.
     """
-    normalized_target = _normalize_loc_id(loc_id)
-    candidate: Optional[dict] = None
-
-    for unit in parcel.units_detail or []:
-        unit_loc = unit.get("loc_id")
-        if unit_loc and _normalize_loc_id(unit_loc) == normalized_target:
-            candidate = unit
-            break
+    loc_index, key_index = _unit_indexes(parcel)
+    candidate: Optional[dict] = loc_index.get(_norm_loc_id(loc_id))
 
     if candidate or not unit_key:
         return candidate
 
-    target_key = str(unit_key).strip().lower()
-    for unit in parcel.units_detail or []:
-        for key_name in ("row_key", "source_id", "id", "unit_number"):
-            value = unit.get(key_name)
-            if value and str(value).strip().lower() == target_key:
-                return unit
-    return candidate
+    return key_index.get(str(unit_key).strip().lower(), candidate)
+
+
+def bulk_get_cached_attom(
+    town_id: int, cache_keys, max_age_days: int = None, miss_max_age_days: int = None
+) -> dict:
+    """
+    Look up fresh cached ATTOM records for many cache keys in a single query.
+
+    Records of confirmed misses (ATTOM has no property) stay fresh for the longer
+    `miss_max_age_days` window so known-absent parcels are not re-queried every cycle.
+
+    Args:
+        town_id: MassGIS town ID
+        cache_keys: Iterable of keys from build_attom_cache_key
+        max_age_days: Maximum age of cached data in days (default: from settings.ATTOM_CACHE_MAX_AGE_DAYS)
+        miss_max_age_days: Maximum age of cached misses in days (default: from settings.ATTOM_MISS_MAX_AGE_DAYS)
+
+    Returns:
+        Dictionary mapping each cached key to its most recently updated AttomData record
+    """
+    from django.utils import timezone
+    from datetime import timedelta
+
+    cache_keys = set(cache_keys)
+    if not cache_keys:
+        return {}
+
+    # Use settings if ages not provided
+    if max_age_days is None:
+        max_age_days = _cache_max_age_days()
+    if miss_max_age_days is None:
+        miss_max_age_days = _miss_max_age_days()
+
+    now = timezone.now()
+    fresh = (
+        Q(is_miss=False, last_updated__gte=now - timedelta(days=max_age_days))
+        | Q(is_miss=True, last_updated__gte=now - timedelta(days=miss_max_age_days))
+    )
+    records = AttomData.objects.filter(
+        fresh,
+        town_id=town_id,
+        loc_id__in=cache_keys,
+    ).order_by("loc_id", "-last_updated")
+
+    cached = {}
+    for record in records:
+        # Rows arrive freshest-first within each loc_id, so keep the first one seen.
+        cached.setdefault(record.loc_id, record)
+    return cached
+
+
+@lru_cache(maxsize=4096)
+def _parse_mailing_address(mailing_address: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Split a "street, city, ST zip" style mailing address into (city, state, zip).
+
+    The city is the first digit-free part after the street (falling back to the second
+    part); state and zip come from the last parts that look like them. Condo units in
+    the same building share mailing addresses, so results are memoized.
+    """
+    city = state = zip_code = None
+    parts = [part.strip() for part in mailing_address.split(",")]
+    parts = [part for part in parts if part]
+
+    for index, part in enumerate(parts):
+        digits = "".join(filter(str.isdigit, part))
+        if index and city is None and not digits:
+            city = part
+        if len(digits) >= 5:
+            zip_code = digits[:5]
+        if len(part) == 2 and part.isalpha():
+            state = part.upper()
+
+    if city is None and len(parts) > 1:
+        city = parts[1]
+    return city, state, zip_code
 
 
 def get_or_fetch_attom_data(
@@ -445,36 +680,48 @@ def get_or_fetch_attom_data(
     Returns:
         Dictionary containing ATTOM data fields or empty dict if unavailable
     """
-    from django.utils import timezone
-    from datetime import timedelta
+    return _get_or_fetch_attom_data(
+        town_id, loc_id, max_age_days, parcel=parcel, unit=unit, unit_key=unit_key
+    )[0]
 
-    # Use setting if max_age_days not provided
-    if max_age_days is None:
-        max_age_days = getattr(settings, "ATTOM_CACHE_MAX_AGE_DAYS", 60)
 
+def _cached_fetch_reason(record: "AttomData") -> str:
+    return FETCH_NOT_FOUND if record.is_miss else FETCH_OK
+
+
+def _get_or_fetch_attom_data(
+    town_id: int,
+    loc_id: str,
+    max_age_days: int = None,
+    *,
+    parcel=None,
+    unit: Optional[dict] = None,
+    unit_key: Optional[str] = None,
+) -> tuple[dict, str]:
+    """
+    get_or_fetch_attom_data, also returning the FETCH_* outcome behind the payload.
+
+    Only FETCH_NOT_FOUND results are cached as misses; FETCH_ERROR results (outages,
+    a rejected API key) are never persisted so the next request tries ATTOM again.
+    """
     cache_key = build_attom_cache_key(loc_id, unit)
     # Check if we have recent cached data for this parcel (across ALL users)
-    cache_cutoff = timezone.now() - timedelta(days=max_age_days)
-    cached_record = AttomData.objects.filter(
-        town_id=town_id,
-        loc_id=cache_key,
-        last_updated__gte=cache_cutoff
-    ).order_by('-last_updated').first()
+    cached_record = bulk_get_cached_attom(town_id, [cache_key], max_age_days).get(cache_key)
 
     if cached_record:
-        print(f"Using cached ATTOM data for parcel {cache_key} (last updated: {cached_record.last_updated})")
+        logger.debug("Using cached ATTOM data for parcel %s (last updated: %s)", cache_key, cached_record.last_updated)
         # Convert the model instance to a dict
-        return _attom_model_to_dict(cached_record)
+        return _attom_model_to_dict(cached_record), _cached_fetch_reason(cached_record)
 
     # No fresh cache, need to fetch from API
-    print(f"No fresh cache found for parcel {cache_key}, fetching from ATTOM API...")
+    logger.debug("No fresh cache found for parcel %s, fetching from ATTOM API", cache_key)
 
     if parcel is None:
         try:
             parcel = get_massgis_parcel_detail(town_id, loc_id)
         except Exception as e:
-            print(f"Error fetching parcel details for loc_id {loc_id}: {e}")
-            return {}
+            logger.warning("Error fetching parcel details for loc_id %s: %s", loc_id, e)
+            return {}, FETCH_ERROR
 
     target_unit = unit or _find_unit_for_loc(parcel, loc_id, unit_key=unit_key)
 
@@ -490,41 +737,30 @@ def get_or_fetch_attom_data(
         elif unit_number and address1:
             address1 = f"{address1} #{unit_number}"
 
-    if not address1 and parcel.units_detail:
-        for unit in parcel.units_detail:
+    if not address1:
+        for unit in parcel.units_detail or ():
             if unit.get("site_address"):
                 address1 = unit["site_address"]
                 break
 
     if not address1:
-        print(f"Parcel {loc_id} is missing street address information.")
-        return {}
+        logger.info("Parcel %s is missing street address information.", loc_id)
+        # Not an ATTOM miss: the lookup could not be built, so keep the regular TTL.
+        return {}, FETCH_BAD_REQUEST
 
     mailing_city = target_unit.get("mailing_city") if target_unit else None
     mailing_state = target_unit.get("mailing_state") if target_unit else None
     mailing_zip = target_unit.get("mailing_zip") if target_unit else None
 
     if target_unit and target_unit.get("mailing_address"):
-        mailing_parts = [part.strip() for part in target_unit.get("mailing_address", "").split(",") if part.strip()]
-        if not mailing_city and len(mailing_parts) >= 2:
-            for part in mailing_parts[1:]:
-                if part and not any(ch.isdigit() for ch in part):
-                    mailing_city = part
-                    break
-            if not mailing_city and len(mailing_parts) > 1:
-                mailing_city = mailing_parts[1]
-
-        for part in reversed(mailing_parts):
-            if not mailing_zip and any(ch.isdigit() for ch in part):
-                digits = "".join(ch for ch in part if ch.isdigit())
-                if len(digits) >= 5:
-                    mailing_zip = digits[:5]
-            if not mailing_state and len(part) == 2 and part.isalpha():
-                mailing_state = part.upper()
+        parsed_city, parsed_state, parsed_zip = _parse_mailing_address(target_unit["mailing_address"])
+        mailing_city = mailing_city or parsed_city
+        mailing_state = mailing_state or parsed_state
+        mailing_zip = mailing_zip or parsed_zip
 
     city_part = mailing_city or (target_unit.get("site_city") if target_unit else None) or parcel.site_city
 
-    state_code = (mailing_state or getattr(settings, "ATTOM_DEFAULT_STATE", "MA")).upper()
+    state_code = (mailing_state or _default_state()).upper()
     postal_zip = mailing_zip or parcel.site_zip
 
     if city_part and postal_zip:
@@ -535,7 +771,7 @@ def get_or_fetch_attom_data(
         address2 = state_code
 
     if not city_part:
-        print(f"Parcel {loc_id} is missing city information for ATTOM lookup; using state fallback.")
+        logger.info("Parcel %s is missing city information for ATTOM lookup; using state fallback.", loc_id)
 
     owner_name = None
     if target_unit:
@@ -543,69 +779,65 @@ def get_or_fetch_attom_data(
     if not owner_name:
         owner_name = getattr(parcel, "owner_name", None)
 
-    print(f"[ATTOM DEBUG] Constructed addresses before calling API:")
-    print(f"[ATTOM DEBUG] address1={repr(address1)}")
-    print(f"[ATTOM DEBUG] address2={repr(address2)}")
-    print(f"[ATTOM DEBUG] owner_name={repr(owner_name)}")
+    logger.debug(
+        "Constructed ATTOM addresses: address1=%r address2=%r owner_name=%r", address1, address2, owner_name
+    )
 
     # Fetch from API
-    attom_data = fetch_attom_data_for_address(address1, address2, owner_name=owner_name)
+    attom_data, reason = _fetch_attom_data_for_address(address1, address2, owner_name=owner_name)
 
-    if attom_data:
-        ensure_attom_cache_record(
+    if reason != FETCH_ERROR:
+        save_attom_cache_records(
             town_id=town_id,
-            loc_id=cache_key,
             payload=attom_data,
-            saved_list=None,
+            targets=[(cache_key, None), (build_attom_cache_key(loc_id, None), None)],
+            is_miss=reason == FETCH_NOT_FOUND,
         )
-        base_key = build_attom_cache_key(loc_id, None)
-        if base_key != cache_key:
-            ensure_attom_cache_record(
-                town_id=town_id,
-                loc_id=base_key,
-                payload=attom_data,
-                saved_list=None,
-            )
 
-    return attom_data
+    return attom_data, reason
+
+
+# AttomData columns exposed as the cached ATTOM payload, in payload order.
+_ATTOM_FIELDS = (
+    "pre_foreclosure",
+    "mortgage_default",
+    "tax_default",
+    "foreclosure_recording_date",
+    "foreclosure_auction_date",
+    "foreclosure_estimated_value",
+    "foreclosure_judgment_amount",
+    "foreclosure_default_amount",
+    "foreclosure_stage",
+    "foreclosure_document_type",
+    "mortgage_loan_amount",
+    "mortgage_loan_type",
+    "mortgage_lender_name",
+    "mortgage_interest_rate",
+    "mortgage_term_years",
+    "mortgage_recording_date",
+    "mortgage_due_date",
+    "mortgage_loan_number",
+    "tax_assessment_year",
+    "tax_assessed_value",
+    "tax_amount_annual",
+    "tax_delinquent_year",
+    "propensity_to_default_score",
+    "propensity_to_default_decile",
+    "raw_response",
+)
+_ATTOM_GETTER = attrgetter(*_ATTOM_FIELDS)
 
 
 def _attom_model_to_dict(attom_record: "AttomData") -> dict:
     """Convert an AttomData model instance to a dictionary."""
-    return {
-        "pre_foreclosure": attom_record.pre_foreclosure,
-        "mortgage_default": attom_record.mortgage_default,
-        "tax_default": attom_record.tax_default,
-        "foreclosure_recording_date": attom_record.foreclosure_recording_date,
-        "foreclosure_auction_date": attom_record.foreclosure_auction_date,
-        "foreclosure_estimated_value": attom_record.foreclosure_estimated_value,
-        "foreclosure_judgment_amount": attom_record.foreclosure_judgment_amount,
-        "foreclosure_default_amount": attom_record.foreclosure_default_amount,
-        "foreclosure_stage": attom_record.foreclosure_stage,
-        "foreclosure_document_type": attom_record.foreclosure_document_type,
-        "mortgage_loan_amount": attom_record.mortgage_loan_amount,
-        "mortgage_loan_type": attom_record.mortgage_loan_type,
-        "mortgage_lender_name": attom_record.mortgage_lender_name,
-        "mortgage_interest_rate": attom_record.mortgage_interest_rate,
-        "mortgage_term_years": attom_record.mortgage_term_years,
-        "mortgage_recording_date": attom_record.mortgage_recording_date,
-        "mortgage_due_date": attom_record.mortgage_due_date,
-        "mortgage_loan_number": attom_record.mortgage_loan_number,
-        "tax_assessment_year": attom_record.tax_assessment_year,
-        "tax_assessed_value": attom_record.tax_assessed_value,
-        "tax_amount_annual": attom_record.tax_amount_annual,
-        "tax_delinquent_year": attom_record.tax_delinquent_year,
-        "propensity_to_default_score": attom_record.propensity_to_default_score,
-        "propensity_to_default_decile": attom_record.propensity_to_default_decile,
-        "raw_response": attom_record.raw_response,
-    }
+    return dict(zip(_ATTOM_FIELDS, _ATTOM_GETTER(attom_record)))
 
 
 def build_attom_cache_key(loc_id: str, unit: Optional[dict] = None) -> str:
     """
     Build a cache key for ATTOM data that is unique per unit when applicable.
     """
-    base = _normalize_loc_id(loc_id)
+    unit_identifier = None
     if unit:
         unit_identifier = (
             unit.get("loc_id")
@@ -613,16 +845,39 @@ def build_attom_cache_key(loc_id: str, unit: Optional[dict] = None) -> str:
             or unit.get("row_key")
             or unit.get("id")
         )
-        if unit_identifier:
-            unit_key = _normalize_loc_id(unit_identifier)
-            if not unit_key:
-                unit_key = str(unit_identifier).strip()
-            if unit_key:
-                return f"{base}::UNIT::{unit_key}"
+    return _cache_key_for(loc_id, unit_identifier or None)
+
+
+@lru_cache(maxsize=100_000)
+def _cache_key_for(loc_id, unit_identifier) -> str:
+    base = _norm_loc_id(loc_id)
+    if unit_identifier:
+        unit_key = _norm_loc_id(unit_identifier)
+        if not unit_key:
+            unit_key = str(unit_identifier).strip()
+        if unit_key:
+            return f"{base}::UNIT::{unit_key}"
     return base
 
 
-def ensure_attom_cache_record(*, town_id: int, loc_id: str, payload: dict, saved_list: Optional[SavedParcelList] = None) -> tuple["AttomData", bool]:
+def _attom_cache_defaults(payload: Optional[dict], is_miss: bool = False) -> dict:
+    if payload is None:
+        payload = {}
+
+    defaults = dict(payload)
+    defaults.setdefault("raw_response", payload.get("raw_response", {}) or {})
+    defaults["is_miss"] = is_miss
+    return defaults
+
+
+def ensure_attom_cache_record(
+    *,
+    town_id: int,
+    loc_id: str,
+    payload: dict,
+    saved_list: Optional[SavedParcelList] = None,
+    is_miss: bool = False,
+) -> tuple["AttomData", bool]:
     """
     Persist ATTOM data for a parcel, optionally scoped to a saved list, and return the record.
 
@@ -631,48 +886,103 @@ def ensure_attom_cache_record(*, town_id: int, loc_id: str, payload: dict, saved
         loc_id: Parcel LOC_ID
         payload: Dictionary of ATTOM fields to store
         saved_list: Optional saved list to associate cached data with
+        is_miss: True only when ATTOM confirmed it has no such property (FETCH_NOT_FOUND)
 
     Returns:
         Tuple of (AttomData instance, created flag)
     """
-    if payload is None:
-        payload = {}
-
-    defaults = dict(payload)
-    defaults.setdefault("raw_response", payload.get("raw_response", {}) or {})
-
     record, created = AttomData.objects.update_or_create(
         town_id=town_id,
         loc_id=loc_id,
         saved_list=saved_list,
-        defaults=defaults,
+        defaults=_attom_cache_defaults(payload, is_miss),
     )
     return record, created
 
 
-def update_attom_data_for_parcel(saved_list: SavedParcelList, town_id: int, loc_id: str):
+def save_attom_cache_records(*, town_id: int, payload: dict, targets, is_miss: bool = False) -> list["AttomData"]:
+    """
+    Persist the same ATTOM payload under several (loc_id, saved_list) keys in one statement.
+
+    Uses a single INSERT ... ON CONFLICT DO UPDATE against the attom_town_loc_list_uniq
+    constraint instead of a SELECT + UPDATE per row. Databases that cannot enforce that
+    constraint (SQLite) fall back to ensure_attom_cache_record for each target.
+
+    Args:
+        town_id: Parcel town identifier
+        payload: Dictionary of ATTOM fields to store
+        targets: Iterable of (loc_id, saved_list) pairs; saved_list may be None
+        is_miss: True only when ATTOM confirmed it has no such property (FETCH_NOT_FOUND)
+
+    Returns:
+        List of the saved AttomData instances
+    """
+    unique_targets = {}
+    for loc_id, saved_list in targets:
+        unique_targets.setdefault((loc_id, getattr(saved_list, "pk", None)), (loc_id, saved_list))
+
+    if not connection.features.supports_nulls_distinct_unique_constraints:
+        return [
+            ensure_attom_cache_record(
+                town_id=town_id, loc_id=loc_id, payload=payload, saved_list=saved_list, is_miss=is_miss
+            )[0]
+            for loc_id, saved_list in unique_targets.values()
+        ]
+
+    defaults = _attom_cache_defaults(payload, is_miss)
+    records = [
+        AttomData(town_id=town_id, loc_id=loc_id, saved_list=saved_list, **defaults)
+        for loc_id, saved_list in unique_targets.values()
+    ]
+    return AttomData.objects.bulk_create(
+        records,
+        update_conflicts=True,
+        unique_fields=["town_id", "loc_id", "saved_list"],
+        update_fields=[*defaults, "last_updated"],
+    )
+
+
+def update_attom_data_for_parcel(
+    saved_list: SavedParcelList,
+    town_id: int,
+    loc_id: str,
+    *,
+    attom_data: Optional[dict] = None,
+    reason: Optional[str] = None,
+):
     """
     Fetches comprehensive foreclosure, mortgage, tax, and default data from the ATTOM API
     for a given parcel and updates the corresponding AttomData model with detailed information.
     Uses cross-user caching to minimize API calls - only fetches new data if cache is stale.
     Cache age is controlled by settings.ATTOM_CACHE_MAX_AGE_DAYS (default: 60 days).
+
+    Pass `attom_data` (and the FETCH_* `reason` it was cached with) when the caller already
+    holds a fresh cached payload to skip the lookup.
     """
-    api_key = settings.ATTOM_API_KEY
+    api_key = _api_key()
     if not api_key:
-        print("ATTOM_API_KEY not found in settings.")
+        logger.warning("ATTOM_API_KEY not found in settings.")
         return
 
-    # Try to get data from cache first (uses settings.ATTOM_CACHE_MAX_AGE_DAYS)
-    attom_data = get_or_fetch_attom_data(town_id, loc_id)
+    if attom_data is None:
+        # Try to get data from cache first (uses settings.ATTOM_CACHE_MAX_AGE_DAYS)
+        attom_data, reason = _get_or_fetch_attom_data(town_id, loc_id)
 
     # Check if we got valid data from the endpoint
     raw_responses = attom_data.get("raw_response", {})
     has_data = bool(
         raw_responses.get("expandedprofile", {}).get("property")
     )
+    if reason is None:
+        reason = FETCH_OK if has_data else FETCH_NOT_FOUND
+
+    if reason == FETCH_ERROR:
+        # An outage or rejected key says nothing about the parcel; retry on the next run.
+        logger.warning("ATTOM lookup failed for parcel %s; not caching the result", loc_id)
+        return
 
     if not attom_data or not has_data:
-        print(f"No property data available for parcel {loc_id}")
+        logger.info("No property data available for parcel %s", loc_id)
         # Still create a record with empty data to avoid repeated API calls
         empty_payload = {
             "pre_foreclosure": False,
@@ -680,35 +990,69 @@ def update_attom_data_for_parcel(saved_list: SavedParcelList, town_id: int, loc_
             "tax_default": False,
             "raw_response": raw_responses,
         }
-        ensure_attom_cache_record(
+        save_attom_cache_records(
             town_id=town_id,
-            loc_id=loc_id,
             payload=empty_payload,
-            saved_list=saved_list,
-        )
-        ensure_attom_cache_record(
-            town_id=town_id,
-            loc_id=loc_id,
-            payload=empty_payload,
-            saved_list=None,
+            targets=[(loc_id, saved_list), (loc_id, None)],
+            is_miss=reason == FETCH_NOT_FOUND,
         )
         return
 
     # Save to database (this will update last_updated timestamp)
     try:
-        _, created_saved = ensure_attom_cache_record(
-            town_id=town_id,
-            loc_id=loc_id,
-            payload=attom_data,
-            saved_list=saved_list,
-        )
-        ensure_attom_cache_record(
+        save_attom_cache_records(
             town_id=town_id,
-            loc_id=loc_id,
             payload=attom_data,
-            saved_list=None,
+            targets=[(loc_id, saved_list), (loc_id, None)],
         )
-        action = "Created" if created_saved else "Updated"
-        print(f"{action} ATTOM data for parcel {loc_id}")
+        logger.info("Saved ATTOM data for parcel %s", loc_id)
     except Exception as e:
-        print(f"Error saving ATTOM data to database for parcel {loc_id}: {type(e).__name__}: {e}")
+        logger.exception("Error saving ATTOM data to database for parcel %s: %s: %s", loc_id, type(e).__name__, e)
+
+
+def update_attom_data_for_parcels(saved_list: SavedParcelList, pairs, max_workers: int = 8) -> list:
+    """
+    Run update_attom_data_for_parcel for many (town_id, loc_id) pairs concurrently.
+
+    Fresh cache entries for the whole batch are loaded up front with one query per
+    town, so only the parcels missing from the cache go to get_or_fetch_attom_data.
+    The per-parcel work is dominated by ATTOM round-trips and database writes, so a
+    thread pool sharing the pooled ATTOM session overlaps that waiting. A failure on
+    one parcel is logged and does not abort the rest of the batch.
+
+    Returns:
+        List of (town_id, loc_id) pairs that raised an error
+    """
+    pairs = list(pairs)
+    failed = []
+    if not pairs:
+        return failed
+
+    keys_by_town = {}
+    for town_id, loc_id in pairs:
+        keys_by_town.setdefault(town_id, set()).add(build_attom_cache_key(loc_id))
+    cached_by_town = {
+        town_id: bulk_get_cached_attom(town_id, cache_keys)
+        for town_id, cache_keys in keys_by_town.items()
+    }
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as executor:
+        futures = {}
+        for town_id, loc_id in pairs:
+            cached_record = cached_by_town[town_id].get(build_attom_cache_key(loc_id))
+            attom_data = reason = None
+            if cached_record:
+                attom_data = _attom_model_to_dict(cached_record)
+                reason = _cached_fetch_reason(cached_record)
+            future = executor.submit(
+                update_attom_data_for_parcel, saved_list, town_id, loc_id, attom_data=attom_data, reason=reason
+            )
+            futures[future] = (town_id, loc_id)
+        for future in as_completed(futures):
+            town_id, loc_id = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.exception("Error updating ATTOM data for parcel %s/%s: %s: %s", town_id, loc_id, type(e).__name__, e)
+                failed.append((town_id, loc_id))
+    return failed
@@ -1,8 +1,12 @@
 import json
-from typing import Dict, List, Optional, Tuple
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
 
 from django import forms
 from django.urls import reverse
+from django.utils.functional import cached_property
 
 from .models import Lead, ScheduleCallRequest, LienRecord, LegalAction, MailerTemplate
 
@@ -17,6 +21,151 @@ class UploadFileForm(forms.Form):
     file = forms.FileField()
 
 
+class _TownChoices(NamedTuple):
+    choices: Tuple[Tuple[str, str], ...]
+    options: Tuple[dict, ...]
+    options_json: str
+    id_to_label: Mapping[int, str]
+    lookup: Mapping[str, Tuple[int, str]]
+
+
+# State -> (source, structures). MA entries are tied to the MassGIS catalog object,
+# which services replaces when the catalog reloads, so a reload invalidates them.
+_TOWN_CHOICES_CACHE: Dict[str, Tuple[object, _TownChoices]] = {}
+
+
+def _town_choices_for_state(state: str) -> _TownChoices:
+    """Town choices and their derived lookups, built once per state and catalog load."""
+    from .services import MassGISDataError, get_massgis_catalog, get_town_choices_for_state
+
+    state = "NH" if state == "NH" else "MA"
+    source = None
+    if state == "MA":
+        try:
+            source = get_massgis_catalog()
+        except (MassGISDataError, Exception):
+            source = None
+
+    cached = _TOWN_CHOICES_CACHE.get(state)
+    if cached is not None and cached[0] is source:
+        return cached[1]
+
+    try:
+        raw_choices = get_town_choices_for_state(state, include_placeholder=False)
+    except (MassGISDataError, Exception):
+        raw_choices = []
+
+    town_id_to_label: Dict[int, str] = {}
+    town_options: List[dict] = []
+    # Lower-cased label, label without the "(FY ...)" suffix, and the id itself.
+    # Keys are interned and every key for a town shares one (id, label) entry.
+    town_lookup: Dict[str, Tuple[int, str]] = {}
+    for value, label in raw_choices:
+        # All entries are regular town IDs
+        try:
+            town_id = int(value)
+        except (TypeError, ValueError):
+            continue
+        town_id_to_label[town_id] = label
+        town_options.append({"id": town_id, "label": label})
+
+        entry = (town_id, label)
+        label_normalized = (label or "").strip().lower()
+        if label_normalized:
+            town_lookup.setdefault(sys.intern(label_normalized), entry)
+
+            base_key = label.split(" (", 1)[0].strip().lower()
+            if base_key:
+                town_lookup.setdefault(sys.intern(base_key), entry)
+
+        town_lookup.setdefault(sys.intern(str(town_id)), entry)
+
+    # Read-only views: these are shared by every form instance across threads.
+    structures = _TownChoices(
+        choices=tuple(raw_choices),
+        options=tuple(town_options),
+        options_json=json.dumps(town_options),
+        id_to_label=MappingProxyType(town_id_to_label),
+        lookup=MappingProxyType(town_lookup),
+    )
+    # Failed loads are retried on the next form rather than cached.
+    if raw_choices:
+        _TOWN_CHOICES_CACHE[state] = (source, structures)
+    return structures
+
+
+@lru_cache(maxsize=None)
+def _url_id_template(url_name: str) -> str:
+    """URL for ``url_name`` with its id argument replaced by ``__id__`` for the front end."""
+    template = reverse(url_name, args=[0]).replace("/0/", "/__id__/")
+    if "__id__" not in template:
+        template = template.replace("0", "__id__", 1)
+    return template
+
+
+_TOWN_DATALIST_ID = "parcel-town-options"
+
+# Widget attribute defaults applied to every ParcelSearchForm.
+_PARCEL_SEARCH_FIELD_ATTRS: Dict[str, Dict[str, str]] = {
+    "town_id": {
+        "class": "form-control",
+        "list": _TOWN_DATALIST_ID,
+        "autocomplete": "off",
+        "spellcheck": "false",
+    },
+    "property_category": {"class": "form-select"},
+    "property_type": {"class": "form-select"},
+    "absentee": {"class": "form-select"},
+    "address_contains": {"class": "form-control"},
+    "style": {"class": "form-control"},
+    "equity_min": {"class": "form-control"},
+    "limit": {"class": "form-control"},
+    "min_price": {"class": "form-control"},
+    "max_price": {"class": "form-control"},
+    "min_years_owned": {"class": "form-control"},
+    "proximity_address": {"class": "form-control"},
+    "proximity_radius_miles": {"class": "form-control"},
+}
+
+
+def _match_town_identifier(
+    town_lookup: Mapping[str, Tuple[int, str]], value: Optional[str]
+) -> Optional[Tuple[int, str]]:
+    """Resolve a submitted town id or label (with or without its FY suffix)."""
+    if not value:
+        return None
+    # Lookup keys are all lower-cased, so one canonical key (and its base) suffices.
+    key = str(value).strip().lower()
+    if not key:
+        return None
+    match = town_lookup.get(key)
+    if match is None and " (" in key:
+        match = town_lookup.get(key.split(" (", 1)[0].rstrip())
+    return match
+
+
+# Static choice lists, declared once instead of rebuilt in every __init__.
+_PROPERTY_CATEGORY_CHOICES = (
+    ("any", "Any"),
+    ("residential", "Residential"),
+    ("commercial", "Commercial"),
+    ("industrial", "Industrial"),
+)
+_COMMERCIAL_SUBTYPE_CHOICES = (
+    ("any", "Any Commercial Type"),
+    ("retail", "Retail"),
+    ("office", "Office"),
+    ("mixed_use", "Mixed Use"),
+    ("service", "Service"),
+)
+_ABSENTEE_CHOICES = (
+    ("any", "Any"),
+    ("owner", "Owner Occupied"),
+    ("absentee", "Absentee"),
+)
+_PROPERTY_TYPE_BASE_CHOICES = (("any", "Any property type"),)
+
+
 class ParcelSearchForm(forms.Form):
     state = forms.ChoiceField(
         label="State",
@@ -33,8 +182,10 @@ class ParcelSearchForm(forms.Form):
         required=False,
         widget=forms.TextInput(attrs={"placeholder": "Start typing a town name (optional)…"}),
     )
-    property_category = forms.ChoiceField(label="Category", choices=(), required=False)
-    commercial_subtype = forms.ChoiceField(label="Commercial Type", choices=(), required=False)
+    property_category = forms.ChoiceField(label="Category", choices=_PROPERTY_CATEGORY_CHOICES, required=False)
+    commercial_subtype = forms.ChoiceField(
+        label="Commercial Type", choices=_COMMERCIAL_SUBTYPE_CHOICES, required=False
+    )
     property_type = forms.ChoiceField(label="Property Type (MassGIS)", choices=(), required=False)
     address_contains = forms.CharField(
         label="Address contains",
@@ -53,7 +204,7 @@ class ParcelSearchForm(forms.Form):
         required=False,
         widget=forms.TextInput(attrs={"placeholder": "e.g. Colonial, Condo"}),
     )
-    absentee = forms.ChoiceField(label="Occupancy", choices=(), required=False)
+    absentee = forms.ChoiceField(label="Occupancy", choices=_ABSENTEE_CHOICES, required=False)
     limit = forms.IntegerField(
         label="Max results",
         min_value=1,
@@ -103,13 +254,12 @@ class ParcelSearchForm(forms.Form):
             MassGISDataError,
             PARCEL_SEARCH_MAX_RESULTS,
             get_massgis_property_type_choices,
-            get_town_choices_for_state,
             preload_massgis_dataset,
         )
 
         # Determine which state is selected
         data = kwargs.get("data")
-        initial = kwargs.get("initial", {})
+        initial = kwargs.get("initial") or {}
         selected_state = None
         if data:
             selected_state = data.get("state", "MA")
@@ -118,131 +268,61 @@ class ParcelSearchForm(forms.Form):
         if not selected_state:
             selected_state = "MA"
 
-        # Get town choices for the selected state
-        try:
-            raw_choices = get_town_choices_for_state(selected_state, include_placeholder=False)
-        except (MassGISDataError, Exception):
-            raw_choices = []
-
-        data = kwargs.get("data")
-        town_id_to_label: dict[int, str] = {}
-        self.town_options: List[dict[str, object]] = []
-        for value, label in raw_choices:
-            # All entries are regular town IDs
-            try:
-                town_id = int(value)
-            except (TypeError, ValueError):
-                continue
-            town_id_to_label[town_id] = label
-            self.town_options.append({"id": town_id, "label": label})
-        self.town_options_json = json.dumps(self.town_options)
-
-        if data:
-            mutable = data.copy()
-            raw_value = mutable.get("town_id")
-            if raw_value and raw_value.isdigit():
-                town_id = int(raw_value)
-                label = town_id_to_label.get(town_id)
-                if label:
-                    mutable["town_id"] = label
-            kwargs["data"] = mutable
+        # Get town choices for the selected state (shared across form instances)
+        town_choices = _town_choices_for_state(selected_state)
+        raw_choices = town_choices.choices
+        town_id_to_label = town_choices.id_to_label
+        self._town_choices = town_choices
+        self.town_options = town_choices.options
+
+        # Submitted town ids are shown back as labels; only copy the data to rewrite one.
+        raw_value = data.get("town_id") if data else None
+        if raw_value and raw_value.isdigit():
+            label = town_id_to_label.get(int(raw_value))
+            if label:
+                mutable = data.copy()
+                mutable["town_id"] = label
+                kwargs["data"] = mutable
 
         super().__init__(*args, **kwargs)
 
         self.cleaned_town_label: Optional[str] = None
-        self.town_datalist_id = "parcel-town-options"
+        self.town_datalist_id = _TOWN_DATALIST_ID
         self.town_datalist = raw_choices
-        self._town_lookup: Dict[str, Tuple[int, str]] = {}
-
-        for value, label in raw_choices:
-            try:
-                town_id = int(value)
-            except (TypeError, ValueError):
-                continue
-
-            label_normalized = (label or "").strip().lower()
-            if label_normalized:
-                self._town_lookup.setdefault(label_normalized, (town_id, label))
-
-                base_key = label.split(" (", 1)[0].strip().lower()
-                if base_key:
-                    self._town_lookup.setdefault(base_key, (town_id, label))
-
-            self._town_lookup.setdefault(str(town_id), (town_id, label))
-
-        def _match_town_identifier(value: Optional[str]) -> Optional[Tuple[int, str]]:
-            if not value:
-                return None
-            variants = []
-            text = str(value).strip()
-            if not text:
-                return None
-            variants.append(text)
-            variants.append(text.lower())
-            if " (" in text:
-                base = text.split(" (", 1)[0].strip()
-                if base:
-                    variants.extend([base, base.lower()])
-            if text.isdigit():
-                variants.append(text)
-            for candidate in variants:
-                match = self._town_lookup.get(candidate)
-                if match:
-                    return match
-            return None
+        self._town_lookup: Mapping[str, Tuple[int, str]] = town_choices.lookup
+        # Stripped town value -> match; the submitted town resolved here is what
+        # clean_town_id resolves again.
+        self._town_resolve_cache: Dict[str, Optional[Tuple[int, str]]] = {}
 
+        form_data = self.data
         matched = None
-        if self.data:
-            matched = _match_town_identifier(self.data.get("town_id"))
-        if matched is None and kwargs.get("initial"):
-            matched = _match_town_identifier(kwargs["initial"].get("town_id"))
+        if form_data:
+            matched = self._resolve_town(form_data.get("town_id"))
+        if matched is None and initial:
+            matched = self._resolve_town(initial.get("town_id"))
 
         self.selected_town_id: Optional[int] = matched[0] if matched else None
 
-        property_type_choices: List[Tuple[str, str]] = [("any", "Any property type")]
-        property_type_options: List[Tuple[str, str]] = []
+        property_type_choices: Tuple[Tuple[str, str], ...] = _PROPERTY_TYPE_BASE_CHOICES
         if self.selected_town_id is not None:
             try:
-                property_type_options = get_massgis_property_type_choices(self.selected_town_id)
+                property_type_choices += tuple(get_massgis_property_type_choices(self.selected_town_id))
             except MassGISDataError:
-                property_type_options = []
-        if property_type_options:
-            property_type_choices.extend(property_type_options)
+                pass
 
         submitted_property_type = None
-        if self.data:
-            submitted_property_type = self.data.get("property_type")
-        elif kwargs.get("initial"):
-            submitted_property_type = kwargs["initial"].get("property_type")
+        if form_data:
+            submitted_property_type = form_data.get("property_type")
+        elif initial:
+            submitted_property_type = initial.get("property_type")
 
         submitted_property_type = (submitted_property_type or "").strip()
-        if submitted_property_type and submitted_property_type not in {choice[0] for choice in property_type_choices}:
-            property_type_choices.append((submitted_property_type, submitted_property_type))
+        if submitted_property_type and all(code != submitted_property_type for code, _ in property_type_choices):
+            property_type_choices += ((submitted_property_type, submitted_property_type),)
 
         self.fields["property_type"].choices = property_type_choices
 
-        self.fields["property_category"].choices = [
-            ("any", "Any"),
-            ("residential", "Residential"),
-            ("commercial", "Commercial"),
-            ("industrial", "Industrial"),
-        ]
-
-        self.fields["commercial_subtype"].choices = [
-            ("any", "Any Commercial Type"),
-            ("retail", "Retail"),
-            ("office", "Office"),
-            ("mixed_use", "Mixed Use"),
-            ("service", "Service"),
-        ]
-
-        self.fields["absentee"].choices = [
-            ("any", "Any"),
-            ("owner", "Owner Occupied"),
-            ("absentee", "Absentee"),
-        ]
-
-        if not self.data:
+        if not form_data:
             self.fields["property_category"].initial = "any"
             self.fields["commercial_subtype"].initial = "any"
             self.fields["property_type"].initial = "any"
@@ -255,7 +335,7 @@ class ParcelSearchForm(forms.Form):
             self.fields["proximity_address"].initial = ""
             self.fields["proximity_radius_miles"].initial = None
         else:
-            limit = self.data.get("limit")
+            limit = form_data.get("limit")
             if limit:
                 try:
                     limit_value = int(limit)
@@ -264,34 +344,33 @@ class ParcelSearchForm(forms.Form):
                 if limit_value:
                     self.fields["limit"].initial = min(limit_value, PARCEL_SEARCH_MAX_RESULTS)
 
-        self.fields["town_id"].widget.attrs.setdefault("class", "form-control")
-        self.fields["town_id"].widget.attrs.setdefault("list", self.town_datalist_id)
-        self.fields["town_id"].widget.attrs.setdefault("autocomplete", "off")
-        self.fields["town_id"].widget.attrs.setdefault("spellcheck", "false")
-        self.fields["property_category"].widget.attrs.setdefault("class", "form-select")
-        self.fields["property_type"].widget.attrs.setdefault("class", "form-select")
-        self.fields["absentee"].widget.attrs.setdefault("class", "form-select")
-        self.fields["address_contains"].widget.attrs.setdefault("class", "form-control")
-        self.fields["style"].widget.attrs.setdefault("class", "form-control")
-        self.fields["equity_min"].widget.attrs.setdefault("class", "form-control")
-        self.fields["limit"].widget.attrs.setdefault("class", "form-control")
-        self.fields["min_price"].widget.attrs.setdefault("class", "form-control")
-        self.fields["max_price"].widget.attrs.setdefault("class", "form-control")
-        self.fields["min_years_owned"].widget.attrs.setdefault("class", "form-control")
-        self.fields["proximity_address"].widget.attrs.setdefault("class", "form-control")
-        self.fields["proximity_radius_miles"].widget.attrs.setdefault("class", "form-control")
+        for name, defaults in _PARCEL_SEARCH_FIELD_ATTRS.items():
+            attrs = self.fields[name].widget.attrs
+            for key, value in defaults.items():
+                attrs.setdefault(key, value)
 
         initial_property_type = submitted_property_type or ""
-        endpoint_template = reverse("property_type_choices", args=[0]).replace("/0/", "/__id__/")
-        if "__id__" not in endpoint_template:
-            endpoint_template = endpoint_template.replace("0", "__id__", 1)
-        preload_template = reverse("town_preload", args=[0]).replace("/0/", "/__id__/")
-        if "__id__" not in preload_template:
-            preload_template = preload_template.replace("0", "__id__", 1)
+        endpoint_template = _url_id_template("property_type_choices")
+        preload_template = _url_id_template("town_preload")
         self.fields["property_type"].widget.attrs.setdefault("data-initial", initial_property_type)
         self.fields["property_type"].widget.attrs.setdefault("data-endpoint-template", endpoint_template)
         self.fields["property_type"].widget.attrs.setdefault("data-preload-template", preload_template)
 
+    @cached_property
+    def town_options_json(self) -> str:
+        # Serialized once per state and catalog load; only templates read it.
+        return self._town_choices.options_json
+
+    def _resolve_town(self, value) -> Optional[Tuple[int, str]]:
+        if not value:
+            return None
+        key = str(value).strip()
+        try:
+            return self._town_resolve_cache[key]
+        except KeyError:
+            match = self._town_resolve_cache[key] = _match_town_identifier(self._town_lookup, key)
+            return match
+
     def clean_town_id(self) -> int:
         raw_value = self.cleaned_data.get("town_id")
         if raw_value is None:
@@ -301,12 +380,7 @@ class ParcelSearchForm(forms.Form):
         if not value:
             raise forms.ValidationError("Please choose a town to search.")
 
-        lookup_key = value.lower()
-        match = self._town_lookup.get(lookup_key)
-
-        if match is None:
-            simplified = value.split(" (", 1)[0].strip().lower()
-            match = self._town_lookup.get(simplified)
+        match = self._resolve_town(value)
 
         if match is None:
             raise forms.ValidationError("Select a town from the suggestions to continue.")
@@ -556,6 +630,11 @@ class LegalActionForm(forms.ModelForm):
         }
 
 
+def _parse_value_props(raw_value_props) -> List[str]:
+    """One value prop per non-blank line, stripped."""
+    return [line.strip() for line in str(raw_value_props).splitlines() if line.strip()]
+
+
 class MailerTemplateForm(forms.ModelForm):
     value_props_raw = forms.CharField(
         label="Bullet points",
@@ -637,11 +716,18 @@ class MailerTemplateForm(forms.ModelForm):
 
     def save(self, commit: bool = True):
         instance = super().save(commit=False)
-        raw_value_props = self.cleaned_data.get("value_props_raw") or ""
-        parsed_value_props = [
-            line.strip() for line in str(raw_value_props).splitlines() if line.strip()
-        ]
-        instance.value_props = parsed_value_props
+        parsed_value_props = _parse_value_props(self.cleaned_data.get("value_props_raw") or "")
+        value_props_changed = parsed_value_props != instance.value_props
+        if value_props_changed:
+            instance.value_props = parsed_value_props
         if commit:
-            instance.save()
+            if instance._state.adding:
+                instance.save()
+            else:
+                # Only write the columns that were edited; an unchanged submit is a no-op.
+                update_fields = [name for name in self._meta.fields if name in self.changed_data]
+                if value_props_changed:
+                    update_fields.append("value_props")
+                if update_fields:
+                    instance.save(update_fields=[*update_fields, "updated_at"])
         return instance
@@ -7,11 +7,16 @@ Sources:
 - Municipal tax lien lists (town websites)
 """
 
+import hashlib
 import logging
+import threading
+from concurrent.futures import Future
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from django.conf import settings
+from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +27,13 @@ logger = logging.getLogger(__name__)
 
 COURTLISTENER_API_BASE = "https://www.courtlistener.com/api/rest/v4"
 COURTLISTENER_API_KEY = getattr(settings, "COURTLISTENER_API_KEY", None)
+# Docket searches are keyed on the owner name, and many parcels share an owner;
+# successful responses are reused for a day to spare the hourly API quota.
+COURTLISTENER_CACHE_TTL = 24 * 60 * 60
+
+# cache key -> Future for docket searches currently in flight (dict.setdefault/pop
+# are atomic under the GIL).
+_COURTLISTENER_INFLIGHT: Dict[str, Future] = {}
 
 
 class CourtListenerError(Exception):
@@ -29,10 +41,38 @@ class CourtListenerError(Exception):
     pass
 
 
+# Shared keep-alive session so background searches reuse TLS connections
+# instead of handshaking on every request. Sized for the lien search pool.
+_COURTLISTENER_SESSION: Optional[requests.Session] = None
+_COURTLISTENER_SESSION_LOCK = threading.Lock()
+
+
+def _get_courtlistener_session() -> requests.Session:
+    """Return the shared CourtListener session, creating it on first use."""
+    global _COURTLISTENER_SESSION
+    session = _COURTLISTENER_SESSION
+    if session is None:
+        with _COURTLISTENER_SESSION_LOCK:
+            session = _COURTLISTENER_SESSION
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=2, pool_maxsize=10)
+                session.mount("https://", adapter)
+                session.headers["Authorization"] = f"Token {COURTLISTENER_API_KEY}"
+                _COURTLISTENER_SESSION = session
+    return session
+
+
+def _courtlistener_cache_key(name: str, limit: int) -> str:
+    digest = hashlib.sha1(f"{name.strip().lower()}|{limit}".encode("utf-8")).hexdigest()
+    return f"lien:courtlistener:v1:{digest}"
+
+
 def search_courtlistener_by_name(
     name: str,
     state: str = "MA",
-    limit: int = 20
+    limit: int = 20,
+    use_cache: bool = True,
 ) -> List[Dict]:
     """
     Search CourtListener for cases involving a person/entity name.
@@ -44,6 +84,7 @@ def search_courtlistener_by_name(
         name: Full name to search (e.g., "John Smith")
         state: State abbreviation (default: MA)
         limit: Maximum results to return
+        use_cache: Reuse a cached result for the same name (errors are never cached)
 
     Returns:
         List of case dictionaries with normalized fields
@@ -66,45 +107,53 @@ def search_courtlistener_by_name(
         logger.warning("CourtListener API key not configured")
         return []
 
-    try:
-        # Search for dockets by party name using v4 API
-        # Focus on MA federal courts (district and bankruptcy)
-        url = f"{COURTLISTENER_API_BASE}/dockets/"
+    cache_key = _courtlistener_cache_key(name, limit)
+    if use_cache:
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        headers = {
-            "Authorization": f"Token {COURTLISTENER_API_KEY}",
-        }
+    # Concurrent searches for the same name share the first caller's request.
+    future = Future()
+    leader = _COURTLISTENER_INFLIGHT.setdefault(cache_key, future)
+    if leader is not future:
+        return leader.result()
+
+    results = []
+    try:
+        results = _fetch_courtlistener_dockets(name, limit)
+    except requests.exceptions.RequestException as e:
+        logger.error(f"CourtListener API error: {e}")
+        # Don't raise - just return empty list to avoid blocking other sources
+    else:
+        cache.set(cache_key, results, COURTLISTENER_CACHE_TTL)
+    finally:
+        _COURTLISTENER_INFLIGHT.pop(cache_key, None)
+        future.set_result(results)
+    return results
 
-        results = []
 
-        # Search MA bankruptcy courts (most relevant for lien/foreclosure searches)
-        ma_bankruptcy_courts = ["mab"]  # MA Bankruptcy Court
+def _fetch_courtlistener_dockets(name: str, limit: int) -> List[Dict]:
+    """Query the MA bankruptcy and district court dockets; raises on HTTP errors."""
+    # Search for dockets by party name using v4 API
+    # Focus on MA federal courts (district and bankruptcy)
+    url = f"{COURTLISTENER_API_BASE}/dockets/"
 
-        for court_id in ma_bankruptcy_courts:
-            params = {
-                "court": court_id,
-                "parties__name__icontains": name,  # Search party names
-                "page_size": limit,
-            }
+    session = _get_courtlistener_session()
 
-            response = requests.get(url, params=params, headers=headers, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+    results = []
 
-            for docket in data.get("results", [])[:limit]:
-                normalized = _normalize_courtlistener_docket(docket)
-                if normalized:
-                    results.append(normalized)
+    # Search MA bankruptcy courts (most relevant for lien/foreclosure searches)
+    ma_bankruptcy_courts = ["mab"]  # MA Bankruptcy Court
 
-        # Also search MA federal district court
-        ma_district_court = "mad"  # MA District Court
+    for court_id in ma_bankruptcy_courts:
         params = {
-            "court": ma_district_court,
-            "parties__name__icontains": name,
+            "court": court_id,
+            "parties__name__icontains": name,  # Search party names
             "page_size": limit,
         }
 
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = session.get(url, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -113,12 +162,24 @@ def search_courtlistener_by_name(
             if normalized:
                 results.append(normalized)
 
-        return results[:limit]  # Limit total results
+    # Also search MA federal district court
+    ma_district_court = "mad"  # MA District Court
+    params = {
+        "court": ma_district_court,
+        "parties__name__icontains": name,
+        "page_size": limit,
+    }
 
-    except requests.exceptions.RequestException as e:
-        logger.error(f"CourtListener API error: {e}")
-        # Don't raise - just return empty list to avoid blocking other sources
-        return []
+    response = session.get(url, params=params, timeout=30)
+    response.raise_for_status()
+    data = response.json()
+
+    for docket in data.get("results", [])[:limit]:
+        normalized = _normalize_courtlistener_docket(docket)
+        if normalized:
+            results.append(normalized)
+
+    return results[:limit]  # Limit total results
 
 
 def _normalize_courtlistener_docket(docket: Dict) -> Optional[Dict]:
@@ -453,7 +514,8 @@ def search_all_sources(
     owner_name: str,
     address: Optional[str] = None,
     town_name: Optional[str] = None,
-    county: Optional[str] = None
+    county: Optional[str] = None,
+    use_cache: bool = True,
 ) -> Tuple[List[Dict], List[Dict]]:
     """
     Search all available sources for liens and legal actions.
@@ -463,6 +525,7 @@ def search_all_sources(
         address: Property address (for tax lien search)
         town_name: Town name (for tax lien search)
         county: County name (for registry search)
+        use_cache: Reuse cached CourtListener results for the same owner name
 
     Returns:
         Tuple of (legal_actions, liens) - lists of dictionaries
@@ -472,7 +535,7 @@ def search_all_sources(
 
     # Search CourtListener for federal cases
     try:
-        courtlistener_results = search_courtlistener_by_name(owner_name)
+        courtlistener_results = search_courtlistener_by_name(owner_name, use_cache=use_cache)
         legal_actions.extend(courtlistener_results)
     except Exception as e:
         logger.error(f"CourtListener search failed: {e}")
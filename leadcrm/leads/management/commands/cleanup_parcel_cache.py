@@ -52,8 +52,10 @@ class Command(BaseCommand):
             # Show sample of what would be deleted
             sample_size = min(10, count)
             self.stdout.write(f'\nSample of entries that would be deleted (showing {sample_size}):')
-            for entry in expired_entries[:sample_size]:
-                days_old = (timezone.now() - entry.last_accessed).days
+            now = timezone.now()
+            sample = expired_entries.only('town_id', 'loc_id', 'last_accessed')[:sample_size]
+            for entry in sample.iterator(chunk_size=sample_size):
+                days_old = (now - entry.last_accessed).days
                 self.stdout.write(
                     f'  - Town {entry.town_id}, LOC_ID {entry.loc_id} '
                     f'(last accessed {days_old} days ago)'
@@ -7,7 +7,7 @@ This dramatically improves map loading performance by:
 3. Serving static files from S3/CDN instead of processing on-demand
 
 Usage:
-    python manage.py generate_town_geojson [--towns TOWN_ID1,TOWN_ID2] [--upload-s3] [--output-dir DIR]
+    python manage.py generate_town_geojson [--towns TOWN_ID1,TOWN_ID2] [--upload-s3] [--output-dir DIR] [--jobs N]
 
 Examples:
     # Generate GeoJSON for all towns to local directory
@@ -21,18 +21,213 @@ Examples:
 
     # Custom output directory
     python manage.py generate_town_geojson --output-dir /tmp/geojson
+
+    # Generate towns in 8 parallel worker processes
+    python manage.py generate_town_geojson --jobs 8
+
+    # Write zstd-compressed files (.geojson.zst) instead of gzip
+    python manage.py generate_town_geojson --compression zstd
 """
 
-import json
+import gzip
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
 
+import orjson
+import zstandard
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
 logger = logging.getLogger(__name__)
 
+# Number of parcels whose vertices are projected together in one vectorized call.
+TRANSFORM_BATCH_SIZE = 2048
+
+# TaxPar DBF columns that nothing downstream reads; skipped when decoding records.
+UNUSED_TAXPAR_FIELDS = frozenset({
+    "OBJECTID",
+    "POLY_TYPE",
+    "SOURCE",
+    "PLAN_ID",
+    "BND_CHK",
+    "NO_MATCH",
+    "last_edite",
+    "created_us",
+    "created_da",
+    "last_edi_1",
+    "ShapeSTAre",
+    "ShapeSTLen",
+    "SHAPE_Leng",
+    "SHAPE_Area",
+})
+
+# Decimal places kept for WGS84 coordinates. Six places is ~0.1 m, well below parcel
+# survey accuracy, and keeps every number in the output short.
+COORDINATE_PRECISION = 6
+
+# GeoJSON is written pre-compressed and served with the matching Content-Encoding.
+# gzip is understood by every client; zstd encodes several times faster and a little
+# smaller, and is offered to clients that advertise it in Accept-Encoding.
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_SUFFIXES = {
+    COMPRESSION_GZIP: ".gz",
+    COMPRESSION_ZSTD: ".zst",
+}
+GZIP_COMPRESSLEVEL = 6
+ZSTD_COMPRESSLEVEL = 3
+
+# Encoded features are collected in a reusable buffer and handed to the compressor in
+# blocks of about this size rather than one small write per feature.
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# S3 uploads are latency-bound, so parts of all files share one pool of concurrent requests.
+S3_MAX_CONCURRENCY = 20
+S3_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _dumps_geojson(payload) -> bytes:
+    """Serialize to compact JSON bytes."""
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+class GeoJSONStreamWriter:
+    """
+    Incrementally write a compressed FeatureCollection, one feature at a time.
+
+    Features are encoded and written as they are produced so peak memory stays at a
+    single feature rather than a whole town. Encoded features are appended to one
+    reusable buffer that is flushed to the compressor in WRITE_BUFFER_SIZE blocks. Output
+    goes to a temporary file that is renamed into place on close(), so an interrupted
+    run never leaves a partial file.
+    """
+
+    def __init__(self, path: Path, compression: str = COMPRESSION_GZIP):
+        self.path = path
+        self.tmp_path = path.with_name(path.name + '.tmp')
+        self.compression = compression
+        self.count = 0
+        self._handle = None
+        self._buffer = bytearray()
+
+    def open(self) -> None:
+        if self.compression == COMPRESSION_ZSTD:
+            compressor = zstandard.ZstdCompressor(level=ZSTD_COMPRESSLEVEL)
+            self._handle = compressor.stream_writer(open(self.tmp_path, 'wb'), closefd=True)
+        else:
+            self._handle = gzip.open(self.tmp_path, 'wb', compresslevel=GZIP_COMPRESSLEVEL)
+        self._buffer += b'{"type":"FeatureCollection","features":['
+
+    def write_feature(self, feature: dict) -> None:
+        buffer = self._buffer
+        if self.count:
+            buffer += b','
+        buffer += _dumps_geojson(feature)
+        self.count += 1
+        if len(buffer) >= WRITE_BUFFER_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._handle.write(self._buffer)
+        self._buffer.clear()
+
+    def close(self, metadata: dict) -> None:
+        self._buffer += b'],"metadata":'
+        self._buffer += _dumps_geojson(metadata)
+        self._buffer += b'}'
+        self._flush()
+        self._handle.close()
+        self._handle = None
+        os.replace(self.tmp_path, self.path)
+
+    def discard(self) -> None:
+        self._buffer.clear()
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        self.tmp_path.unlink(missing_ok=True)
+
+
+TOWN_SUCCESS = "success"
+TOWN_EMPTY = "empty"
+TOWN_ERROR = "error"
+
+
+def _init_worker() -> None:
+    """Make sure Django is configured in worker processes (needed for spawn start methods)."""
+    import django
+
+    django.setup()
+
+
+def _town_output_filename(town_id: int, compression: str = COMPRESSION_GZIP) -> str:
+    """
+    Canonical file name (and S3 key basename) for a town.
+
+    Only the town ID is used so URLs and CDN cache keys survive town-name cleanups; the
+    friendly name is kept in the file's metadata block.
+    """
+    return f"town_{town_id}.geojson{COMPRESSION_SUFFIXES[compression]}"
+
+
+def _process_town(
+    town_id: int,
+    output_dir: Path,
+    limit: Optional[int],
+    compression: str = COMPRESSION_GZIP,
+) -> tuple[str, int, str]:
+    """
+    Generate the GeoJSON file for a single town.
+
+    Runs either in-process or inside a ProcessPoolExecutor worker, so it is a module-level
+    function that reports back a ``(status, town_id, message)`` tuple instead of writing
+    to the command's stdout.
+    """
+    from leads.services import _get_massgis_town
+
+    try:
+        town = _get_massgis_town(town_id)
+        output_file = output_dir / _town_output_filename(town_id, compression)
+
+        writer = GeoJSONStreamWriter(output_file, compression)
+        writer.open()
+        try:
+            for parcel in Command()._iter_parcels_for_town(town_id, limit):
+                geometry = parcel.pop('geometry', None)
+                if not geometry:
+                    continue
+                writer.write_feature({
+                    "type": "Feature",
+                    "geometry": geometry,
+                    "properties": parcel,
+                })
+        except BaseException:
+            writer.discard()
+            raise
+
+        parcel_count = writer.count
+        if parcel_count == 0:
+            writer.discard()
+            return TOWN_EMPTY, town_id, f"⚠️  No valid parcel geometries for {town.name}"
+
+        writer.close({
+            "town_id": town_id,
+            "town_name": town.name,
+            "parcel_count": parcel_count,
+            "generated_by": "generate_town_geojson management command",
+        })
+
+        file_size_mb = output_file.stat().st_size / 1024 / 1024
+        return TOWN_SUCCESS, town_id, f"✅ {town.name}: {parcel_count} parcels, {file_size_mb:.2f} MB"
+
+    except Exception as e:
+        logger.exception(f"Error generating GeoJSON for town {town_id}")
+        return TOWN_ERROR, town_id, f"❌ Error processing town {town_id}: {e}"
+
 
 class Command(BaseCommand):
     help = "Pre-generate GeoJSON files for Massachusetts towns to improve map loading performance"
@@ -64,108 +259,86 @@ class Command(BaseCommand):
             action='store_true',
             help='Regenerate files even if they already exist',
         )
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of worker processes used to generate towns in parallel (default: CPU count)',
+        )
+        parser.add_argument(
+            '--compression',
+            choices=sorted(COMPRESSION_SUFFIXES),
+            default=COMPRESSION_GZIP,
+            help='Compression for the generated files (default: gzip)',
+        )
 
     def handle(self, *args, **options):
-        from leads.services import (
-            _get_massgis_town,
-            get_massgis_catalog,
-        )
+        from leads.services import get_massgis_catalog
 
         towns_filter = options.get('towns')
         output_dir = Path(options['output_dir'])
         upload_s3 = options.get('upload_s3', False)
         limit = options.get('limit')
         force = options.get('force', False)
+        compression = options.get('compression') or COMPRESSION_GZIP
 
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
         self.stdout.write(f"Output directory: {output_dir.absolute()}")
 
         # Determine which towns to process
+        massgis_catalog = get_massgis_catalog()
         if towns_filter:
             town_ids = [int(tid.strip()) for tid in towns_filter.split(',')]
             self.stdout.write(f"Processing {len(town_ids)} specific towns: {town_ids}")
         else:
-            massgis_catalog = get_massgis_catalog()
             town_ids = sorted(massgis_catalog.keys())
             self.stdout.write(f"Processing all {len(town_ids)} Massachusetts towns")
 
+        jobs = max(1, options.get('jobs') or 1)
+
         # Stats
         success_count = 0
         skip_count = 0
         error_count = 0
 
-        for town_id in town_ids:
-            try:
-                town = _get_massgis_town(town_id)
-                safe_name = town.name.replace(' ', '_').replace('/', '_')
-                output_file = output_dir / f"town_{town_id}_{safe_name}.geojson"
-
-                # Skip if already exists and not forcing
-                if output_file.exists() and not force:
-                    self.stdout.write(self.style.WARNING(f"⏭️  Skipping {town.name} (ID: {town_id}) - file exists"))
+        # Skip towns whose file already exists, using one directory listing
+        # instead of a stat() per town before any town data is loaded.
+        if not force:
+            existing_files = {entry.name for entry in os.scandir(output_dir)}
+            remaining = []
+            for town_id in town_ids:
+                if _town_output_filename(town_id, compression) in existing_files:
+                    town = massgis_catalog.get(town_id)
+                    town_label = town.name if town else "town"
+                    self.stdout.write(self.style.WARNING(f"⏭️  Skipping {town_label} (ID: {town_id}) - file exists"))
                     skip_count += 1
                     continue
-
-                self.stdout.write(f"📍 Processing {town.name} (ID: {town_id})...")
-
-                parcels = self._load_parcels_for_town(town_id, limit)
-
-                if not parcels:
-                    self.stdout.write(self.style.WARNING(f"⚠️  No parcels returned for {town.name}"))
-                    continue
-
-                features = []
-                for parcel in parcels:
-                    geometry = parcel.get('geometry')
-                    if not geometry:
-                        continue
-                    properties = dict(parcel)
-                    properties.pop('geometry', None)
-
-                    feature = {
-                        "type": "Feature",
-                        "geometry": geometry,
-                        "properties": properties,
-                    }
-                    features.append(feature)
-
-                parcel_count = len(features)
-                if parcel_count == 0:
-                    self.stdout.write(self.style.WARNING(f"⚠️  No valid parcel geometries for {town.name}"))
-                    continue
-
-                geojson = {
-                    "type": "FeatureCollection",
-                    "features": features,
-                    "metadata": {
-                        "town_id": town_id,
-                        "town_name": town.name,
-                        "parcel_count": parcel_count,
-                        "generated_by": "generate_town_geojson management command",
-                    },
-                }
-
-                # Write to file
-                with open(output_file, 'w') as f:
-                    json.dump(geojson, f, separators=(',', ':'))  # Compact JSON
-
-                file_size_mb = output_file.stat().st_size / 1024 / 1024
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"✅ {town.name}: {parcel_count} parcels, {file_size_mb:.2f} MB"
-                    )
+                remaining.append(town_id)
+            town_ids = remaining
+
+        if jobs > 1 and len(town_ids) > 1:
+            self.stdout.write(f"Using {jobs} worker processes")
+            executor = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker)
+            with executor:
+                results = executor.map(
+                    _process_town,
+                    town_ids,
+                    repeat(output_dir),
+                    repeat(limit),
+                    repeat(compression),
+                    chunksize=4,
                 )
-
-                success_count += 1
-
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(f"❌ Error processing town {town_id}: {e}")
-                )
-                logger.exception(f"Error generating GeoJSON for town {town_id}")
-                error_count += 1
-                continue
+                for status, town_id, message in results:
+                    self._report_town_result(status, message)
+                    success_count += status == TOWN_SUCCESS
+                    error_count += status == TOWN_ERROR
+        else:
+            for town_id in town_ids:
+                status, town_id, message = _process_town(town_id, output_dir, limit, compression)
+                self._report_town_result(status, message)
+                success_count += status == TOWN_SUCCESS
+                error_count += status == TOWN_ERROR
 
         # Summary
         self.stdout.write("\n" + "=" * 60)
@@ -182,28 +355,27 @@ class Command(BaseCommand):
             uploaded = self._upload_to_s3(output_dir)
             self.stdout.write(self.style.SUCCESS(f"✅ Uploaded {uploaded} files to S3"))
 
-    def _load_parcels_for_town(self, town_id: int, limit: Optional[int]) -> list[dict]:
-        """Load all parcel records for a town using the same logic as the API."""
+    def _report_town_result(self, status: str, message: str) -> None:
+        if status == TOWN_SUCCESS:
+            self.stdout.write(self.style.SUCCESS(message))
+        elif status == TOWN_ERROR:
+            self.stdout.write(self.style.ERROR(message))
+        else:
+            self.stdout.write(self.style.WARNING(message))
+
+    def _iter_parcels_for_town(self, town_id: int, limit: Optional[int]) -> Iterator[dict]:
+        """Yield parcel records for a town using the same logic as the API."""
         import shapefile
-        from collections import defaultdict
 
         from leads.services import (
             _clean_string,
-            _classify_use_code,
-            _compose_owner_address,
             _ensure_massgis_dataset,
             _find_taxpar_shapefile,
-            _format_address,
             _get_massgis_town,
-            _get_use_description,
-            _is_absentee,
+            _load_assess_index,
             _load_assess_records,
             _load_usecode_lookup,
-            _should_replace_assess_record,
-            _summarize_unit_records,
-            _geometry_centroid,
-            _shape_to_geojson_geometry,
-            calculate_equity_metrics,
+            _transform_geometries_to_wgs84,
         )
 
         town = _get_massgis_town(town_id)
@@ -211,124 +383,178 @@ class Command(BaseCommand):
         tax_par_path = _find_taxpar_shapefile(dataset_dir)
 
         sf = shapefile.Reader(str(tax_par_path))
-        field_names = [field[0] for field in sf.fields[1:]]
+        # Only decode the DBF columns the parcel builder can read; GIS bookkeeping
+        # columns (edit stamps, shape stats) cost a parse - often a date parse - per row.
+        field_names = [
+            field[0] for field in sf.fields[1:]
+            if field[0] not in UNUSED_TAXPAR_FIELDS
+        ]
 
         assess_records = _load_assess_records(str(dataset_dir))
         usecode_lookup = _load_usecode_lookup(str(dataset_dir))
 
-        assess_index: dict[str, dict] = {}
-        unit_records_map: dict[str, list] = defaultdict(list)
-        for record in assess_records:
-            for key_name in ("LOC_ID", "MAP_PAR_ID", "PID", "GIS_ID"):
-                key_value = _clean_string(record.get(key_name))
-                if not key_value:
+        assess_index, unit_records_map = _load_assess_index(str(dataset_dir), assess_records)
+        build_parcel = self._parcel_builder(town, usecode_lookup)
+
+        yielded = 0
+        # Shapes are projected to WGS84 in batches so every vertex of a batch goes
+        # through one vectorized transform instead of one call per point.
+        pending: list[tuple[dict, dict, str, Optional[list]]] = []
+
+        def flush_pending() -> Iterator[dict]:
+            nonlocal yielded
+            geometries = _transform_geometries_to_wgs84(
+                [item[1] for item in pending],
+                precision=COORDINATE_PRECISION,
+            )
+            batch = list(pending)
+            pending.clear()
+            for (attributes, _, site_addr, unit_records), geometry in zip(batch, geometries):
+                if limit is not None and yielded >= limit:
+                    return
+                if not geometry:
                     continue
-                unit_records_map[key_value].append(record)
-                existing = assess_index.get(key_value)
-                if existing is None or _should_replace_assess_record(record, existing):
-                    assess_index[key_value] = record
-
-        parcels: list[dict] = []
-
-        for shape_record in sf.shapeRecords():
-            if limit is not None and len(parcels) >= limit:
-                break
-
-            shape = shape_record.shape
-            if not shape.points:
-                continue
-
-            attributes = dict(zip(field_names, shape_record.record))
-
-            assess_data = None
-            unit_records = None
-            lookup_keys = [
-                _clean_string(attributes.get("LOC_ID")),
-                _clean_string(attributes.get("MAP_PAR_ID")),
-            ]
-            for key in lookup_keys:
-                if key and key in assess_index:
-                    assess_data = assess_index[key]
-                    unit_records = unit_records_map.get(key)
-                    break
-
-            if assess_data:
-                attributes.update(assess_data)
-            if unit_records is None:
+                yielded += 1
+                yield build_parcel(attributes, site_addr, geometry, unit_records)
+
+        try:
+            # Features are emitted in shapefile order on purpose. TaxPar files are already
+            # ordered by map/parcel ID, which keeps neighbouring parcels (and their shared
+            # street and owner strings) together; re-sorting along a Hilbert curve made the
+            # compressed output larger, not smaller, and would require buffering the town.
+            for shape_record in sf.iterShapeRecords(fields=field_names):
+                if limit is not None and yielded + len(pending) >= limit:
+                    yield from flush_pending()
+                    if yielded >= limit:
+                        break
+
+                shape = shape_record.shape
+                if not shape.points:
+                    continue
+
+                attributes = dict(zip(field_names, shape_record.record))
+
+                assess_data = None
+                unit_records = None
+                lookup_keys = [
+                    _clean_string(attributes.get("LOC_ID")),
+                    _clean_string(attributes.get("MAP_PAR_ID")),
+                ]
                 for key in lookup_keys:
-                    if key and unit_records_map.get(key):
-                        unit_records = unit_records_map[key]
+                    if key and key in assess_index:
+                        assess_data = assess_index[key]
+                        unit_records = unit_records_map.get(key)
                         break
 
-            geometry = _shape_to_geojson_geometry(shape)
-            if not geometry:
-                continue
-            centroid_point = _geometry_centroid(geometry)
+                if assess_data:
+                    attributes.update(assess_data)
+                if unit_records is None:
+                    for key in lookup_keys:
+                        if key and unit_records_map.get(key):
+                            unit_records = unit_records_map[key]
+                            break
+
+                site_addr = _clean_string(attributes.get("SITE_ADDR")) or _clean_string(attributes.get("LOC_ADDR"))
+                if not site_addr:
+                    fallback_source = (
+                        _clean_string(attributes.get("MAP_PAR_ID"))
+                        or _clean_string(attributes.get("LOC_ID"))
+                    )
+                    if fallback_source:
+                        site_addr = f"Parcel {fallback_source}"
+                        attributes["SITE_ADDR"] = site_addr
+                    else:
+                        continue
 
-            site_addr = _clean_string(attributes.get("SITE_ADDR")) or _clean_string(attributes.get("LOC_ADDR"))
-            if not site_addr:
-                fallback_source = (
-                    _clean_string(attributes.get("MAP_PAR_ID"))
-                    or _clean_string(attributes.get("LOC_ID"))
-                )
-                if fallback_source:
-                    site_addr = f"Parcel {fallback_source}"
-                    attributes["SITE_ADDR"] = site_addr
-                else:
-                    continue
+                if not attributes.get("SITE_CITY"):
+                    attributes["SITE_CITY"] = town.name.title()
+
+                pending.append((attributes, shape.__geo_interface__, site_addr, unit_records))
+                if len(pending) >= TRANSFORM_BATCH_SIZE:
+                    yield from flush_pending()
+
+            if pending:
+                yield from flush_pending()
+        finally:
+            sf.close()
+
+    def _parcel_builder(self, town, usecode_lookup: dict) -> Callable[[dict, str, dict, Optional[list]], dict]:
+        """
+        Return a function that builds the feature properties for one parcel of ``town``.
+
+        Helper imports and per-town values are resolved once here rather than on every
+        parcel, and the builder reads each source column a single time.
+        """
+        from leads.services import (
+            _clean_string,
+            _classify_use_code,
+            _compose_owner_address,
+            _format_address,
+            _geometry_centroid,
+            _get_use_description,
+            _is_absentee,
+            _summarize_unit_records,
+            calculate_equity_metrics,
+        )
 
-            if not attributes.get("SITE_CITY"):
-                attributes["SITE_CITY"] = town.name.title()
+        town_id = town.town_id
+        town_name = town.name
+        default_city = town_name.title()
 
-            use_code = attributes.get("USE_CODE", "")
+        def build_parcel(attributes: dict, site_addr: str, geometry: dict, unit_records: Optional[list]) -> dict:
+            get = attributes.get
+
+            centroid_point = _geometry_centroid(geometry)
+            if centroid_point:
+                centroid_point = {
+                    "lat": round(centroid_point["lat"], COORDINATE_PRECISION),
+                    "lng": round(centroid_point["lng"], COORDINATE_PRECISION),
+                }
+
+            use_code = get("USE_CODE", "")
             use_desc = _get_use_description(use_code, usecode_lookup)
-            property_category = _classify_use_code(use_code)
-            is_absentee = _is_absentee(attributes)
             equity_percent, _, _, _, _, _ = calculate_equity_metrics(attributes)
+            site_city = _clean_string(get("SITE_CITY")) or _clean_string(get("CITY"))
+            site_zip = _clean_string(get("SITE_ZIP")) or _clean_string(get("ZIP"))
+            total_value = get("TOTAL_VAL")
 
-            parcel = {
-                "loc_id": attributes.get("LOC_ID", ""),
+            return {
+                "loc_id": get("LOC_ID", ""),
                 "town_id": town_id,
-                "town_name": town.name,
+                "town_name": town_name,
                 "address": _format_address(attributes),
                 "site_address": site_addr,
-                "owner": attributes.get("OWNER1") or attributes.get("OWNER_NAME", "Unknown"),
+                "owner": get("OWNER1") or get("OWNER_NAME", "Unknown"),
                 "owner_address": _compose_owner_address(attributes),
-                "total_value": attributes.get("TOTAL_VAL"),
-                "land_value": attributes.get("LAND_VAL"),
-                "building_value": attributes.get("BLDG_VAL"),
+                "total_value": total_value,
+                "land_value": get("LAND_VAL"),
+                "building_value": get("BLDG_VAL"),
                 "property_type": use_desc,
-                "property_category": property_category,
+                "property_category": _classify_use_code(use_code),
                 "use_code": use_code,
                 "use_description": use_desc,
-                "style": _clean_string(attributes.get("STYLE")),
-                "year_built": attributes.get("YEAR_BUILT"),
-                "units": attributes.get("UNITS"),
-                "lot_size": attributes.get("LOT_SIZE"),
-                "lot_units": _clean_string(attributes.get("LOT_UNITS")),
-                "zoning": _clean_string(attributes.get("ZONING")),
-                "zone": _clean_string(attributes.get("ZONE")),
-                "absentee": is_absentee,
+                "style": _clean_string(get("STYLE")),
+                "year_built": get("YEAR_BUILT"),
+                "units": get("UNITS"),
+                "lot_size": get("LOT_SIZE"),
+                "lot_units": _clean_string(get("LOT_UNITS")),
+                "zoning": _clean_string(get("ZONING")),
+                "zone": _clean_string(get("ZONE")),
+                "absentee": _is_absentee(attributes),
                 "equity_percent": equity_percent,
-                "last_sale_price": attributes.get("LS_PRICE"),
-                "last_sale_date": _clean_string(attributes.get("LS_DATE")),
-                "site_city": _clean_string(attributes.get("SITE_CITY")) or _clean_string(attributes.get("CITY")),
-                "site_zip": _clean_string(attributes.get("SITE_ZIP")) or _clean_string(attributes.get("ZIP")),
-                "city": _clean_string(attributes.get("SITE_CITY")) or _clean_string(attributes.get("CITY")) or town.name.title(),
-                "zip": _clean_string(attributes.get("SITE_ZIP")) or _clean_string(attributes.get("ZIP")),
-                "value_display": None,
+                "last_sale_price": get("LS_PRICE"),
+                "last_sale_date": _clean_string(get("LS_DATE")),
+                "site_city": site_city,
+                "site_zip": site_zip,
+                "city": site_city or default_city,
+                "zip": site_zip,
+                "value_display": f"${float(total_value):,.0f}" if total_value else None,
                 "centroid": centroid_point,
                 "geometry": geometry,
                 "units_detail": _summarize_unit_records(unit_records) if unit_records else None,
             }
 
-            total_value = parcel.get("total_value")
-            if total_value:
-                parcel["value_display"] = f"${float(total_value):,.0f}"
-
-            parcels.append(parcel)
-
-        return parcels
+        return build_parcel
 
     def _upload_to_s3(self, output_dir: Path) -> int:
         """Upload generated GeoJSON files to S3"""
@@ -338,7 +564,9 @@ class Command(BaseCommand):
 
         try:
             import boto3
+            from boto3.s3.transfer import TransferConfig
             from botocore.exceptions import ClientError
+            from s3transfer.manager import TransferManager
 
             s3_client = boto3.client(
                 's3',
@@ -346,28 +574,43 @@ class Command(BaseCommand):
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
                 region_name=settings.AWS_S3_REGION_NAME,
             )
+            transfer_config = TransferConfig(
+                multipart_threshold=S3_MULTIPART_CHUNK_SIZE,
+                multipart_chunksize=S3_MULTIPART_CHUNK_SIZE,
+                max_concurrency=S3_MAX_CONCURRENCY,
+            )
 
             bucket = settings.AWS_STORAGE_BUCKET_NAME
             uploaded = 0
 
-            for geojson_file in output_dir.glob("*.geojson"):
-                s3_key = f"geojson/towns/{geojson_file.name}"
-
-                try:
-                    s3_client.upload_file(
-                        str(geojson_file),
-                        bucket,
-                        s3_key,
-                        ExtraArgs={
-                            'ContentType': 'application/geo+json',
-                            'CacheControl': 'public, max-age=31536000',  # 1 year cache
-                        }
-                    )
+            # One TransferManager queues every file, so whole files and the parts of
+            # multipart uploads are all scheduled on the same request pool.
+            with TransferManager(s3_client, config=transfer_config) as manager:
+                transfers = []
+                for suffix in COMPRESSION_SUFFIXES.values():
+                    for geojson_file in output_dir.glob(f"*.geojson{suffix}"):
+                        s3_key = f"geojson/towns/{geojson_file.name}"
+                        content_encoding = COMPRESSION_ZSTD if suffix == '.zst' else COMPRESSION_GZIP
+                        future = manager.upload(
+                            str(geojson_file),
+                            bucket,
+                            s3_key,
+                            extra_args={
+                                'ContentType': 'application/geo+json',
+                                'ContentEncoding': content_encoding,
+                                'CacheControl': 'public, max-age=31536000',  # 1 year cache
+                            },
+                        )
+                        transfers.append((geojson_file, s3_key, future))
+
+                for geojson_file, s3_key, future in transfers:
+                    try:
+                        future.result()
+                    except ClientError as e:
+                        self.stdout.write(self.style.ERROR(f"  ❌ Failed to upload {geojson_file.name}: {e}"))
+                        continue
                     self.stdout.write(f"  ✅ Uploaded: {s3_key}")
                     uploaded += 1
-                except ClientError as e:
-                    self.stdout.write(self.style.ERROR(f"  ❌ Failed to upload {geojson_file.name}: {e}"))
-                    continue
 
             return uploaded
 
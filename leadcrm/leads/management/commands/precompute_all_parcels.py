@@ -8,6 +8,7 @@ from datetime import datetime, date
 from typing import Dict, List, Optional, Sequence
 from decimal import Decimal
 
+import numpy as np
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.utils import timezone
@@ -21,6 +22,7 @@ from ...services import (
     _should_replace_assess_record,
     get_massgis_catalog,
     _classify_use_code,
+    massgis_stateplane_to_wgs84_array,
 )
 
 
@@ -199,35 +201,37 @@ class Command(BaseCommand):
                 self.stderr.write(self.style.WARNING("  ⚠ No LOC_ID field in shapefile"))
                 return geometries
 
-            # Extract centroids
-            for shape_record in sf.shapeRecords():
-                loc_id_raw = shape_record.record[loc_id_idx]
-                loc_id = _normalize_loc_id(loc_id_raw)
-
-                if not loc_id or not shape_record.shape.points:
-                    continue
+            # Extract vertex-mean centroids, then project them all in one vectorized call
+            loc_ids: List[str] = []
+            centroids: List[np.ndarray] = []
+            try:
+                # Stream shapes and decode only the LOC_ID column from the DBF
+                for shape_record in sf.iterShapeRecords(fields=[field_names[loc_id_idx]]):
+                    loc_id_raw = shape_record.record[0]
+                    loc_id = _normalize_loc_id(loc_id_raw)
 
-                # Calculate centroid from points
-                points = shape_record.shape.points
-                if points:
-                    avg_x = sum(p[0] for p in points) / len(points)
-                    avg_y = sum(p[1] for p in points) / len(points)
+                    if not loc_id or not shape_record.shape.points:
+                        continue
 
-                    # Convert from State Plane to WGS84 (lat/lon)
-                    try:
-                        from ...services import massgis_stateplane_to_wgs84
-                        lon, lat = massgis_stateplane_to_wgs84(avg_x, avg_y)
-
-                        geometries[loc_id] = {
-                            'centroid_lon': lon,
-                            'centroid_lat': lat,
-                        }
-                    except Exception:
-                        # Fallback: assume already in WGS84
-                        geometries[loc_id] = {
-                            'centroid_lon': avg_x,
-                            'centroid_lat': avg_y,
-                        }
+                    points = np.asarray(shape_record.shape.points, dtype=np.float64)
+                    loc_ids.append(loc_id)
+                    centroids.append(points[:, :2].mean(axis=0))
+            finally:
+                sf.close()
+
+            if centroids:
+                stateplane = np.vstack(centroids)
+                lons, lats = massgis_stateplane_to_wgs84_array(stateplane[:, 0], stateplane[:, 1])
+                # Fallback: points that fail to project are assumed to be WGS84 already
+                unprojected = np.isnan(lons) | np.isnan(lats)
+                lons = np.where(unprojected, stateplane[:, 0], lons)
+                lats = np.where(unprojected, stateplane[:, 1], lats)
+
+                for loc_id, lon, lat in zip(loc_ids, lons.tolist(), lats.tolist()):
+                    geometries[loc_id] = {
+                        'centroid_lon': lon,
+                        'centroid_lat': lat,
+                    }
 
         except Exception as exc:
             self.stderr.write(self.style.WARNING(f"  ⚠ Error loading geometries: {exc}"))
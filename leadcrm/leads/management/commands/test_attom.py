@@ -1,120 +1,198 @@
 """
 Management command to test ATTOM API and see actual response structure.
-Usage: python manage.py test_attom <town_id> <loc_id>
+Usage: python manage.py test_attom <town_id> <loc_id> [<town_id> <loc_id> ...] [--compact] [--workers N] [--celery]
 """
-import json
-from django.core.management.base import BaseCommand
-from leads.services import get_massgis_parcel_detail
-from leads.attom_service import fetch_attom_data_for_address
+import io
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from django.core.management.base import BaseCommand, CommandError
+from leads.attom_debug import inspect_parcel
 
 
 class Command(BaseCommand):
-    help = 'Test ATTOM API for a specific parcel and display the response structure'
+    help = 'Test ATTOM API for one or more parcels and display the response structure'
 
     def add_arguments(self, parser):
-        parser.add_argument('town_id', type=int, help='MassGIS Town ID')
-        parser.add_argument('loc_id', type=str, help='Parcel Location ID')
+        parser.add_argument(
+            'parcels',
+            nargs='+',
+            metavar='TOWN_ID LOC_ID',
+            help='MassGIS Town ID and Parcel Location ID; repeat the pair to test several parcels',
+        )
+        parser.add_argument(
+            '--compact',
+            action='store_true',
+            help='Save the full response as compact JSON instead of indented JSON',
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Parcels fetched concurrently in-process when testing several parcels (default: 8)',
+        )
+        parser.add_argument(
+            '--celery',
+            action='store_true',
+            help='Fetch parcels concurrently as Celery tasks (responses are saved on the workers)',
+        )
+        parser.add_argument(
+            '--timeout',
+            type=int,
+            default=600,
+            help='Seconds to wait for Celery results (default: 600)',
+        )
 
     def handle(self, *args, **options):
-        town_id = options['town_id']
-        loc_id = options['loc_id']
-
-        self.stdout.write(f"\nTesting ATTOM API for parcel: {town_id} / {loc_id}\n")
-        self.stdout.write("="*80)
+        parcels = self._parse_parcels(options['parcels'])
+        compact = options.get('compact', False)
+
+        if options.get('celery'):
+            results = self._inspect_with_celery(parcels, compact, options['timeout'])
+        else:
+            results = self._inspect_in_process(parcels, compact, options['workers'])
+
+        for result in results:
+            self._report(result)
+
+    def _parse_parcels(self, values: list) -> list:
+        if len(values) % 2:
+            raise CommandError("Parcels must be given as TOWN_ID LOC_ID pairs")
+        parcels = []
+        for town_id, loc_id in zip(values[::2], values[1::2]):
+            try:
+                parcels.append((int(town_id), loc_id))
+            except ValueError:
+                raise CommandError(f"Invalid town ID: {town_id}")
+        return parcels
+
+    def _inspect_in_process(self, parcels: list, compact: bool, workers: int) -> list:
+        # ATTOM calls are network-bound, so threads overlap them; results keep input order.
+        workers = max(1, min(workers, len(parcels)))
+        if workers == 1:
+            return [inspect_parcel(town_id, loc_id, compact) for town_id, loc_id in parcels]
+        town_ids, loc_ids = zip(*parcels)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(inspect_parcel, town_ids, loc_ids, repeat(compact)))
+
+    def _inspect_with_celery(self, parcels: list, compact: bool, timeout: int) -> list:
+        from celery import group
+        from leads.tasks import fetch_and_dump_attom
+
+        job = group(fetch_and_dump_attom.s(town_id, loc_id, compact) for town_id, loc_id in parcels)
+        outcomes = job.apply_async().get(timeout=timeout, propagate=False)
+
+        results = []
+        for (town_id, loc_id), outcome in zip(parcels, outcomes):
+            if isinstance(outcome, dict):
+                results.append(outcome)
+            else:
+                # The task itself failed (e.g. time limit); report it like any other error.
+                results.append({
+                    "town_id": town_id,
+                    "loc_id": loc_id,
+                    "error": f"{type(outcome).__name__}: {outcome}",
+                })
+        return results
+
+    def _report(self, result: dict) -> None:
+        # Output is collected in memory and written to stdout once at the end.
+        buffer = io.StringIO()
+
+        def write(msg: str = "") -> None:
+            buffer.write(msg if msg.endswith("\n") else msg + "\n")
 
         try:
-            # Get parcel details from MassGIS
-            parcel = get_massgis_parcel_detail(town_id, loc_id)
-
-            self.stdout.write(f"\nParcel Address:")
-            self.stdout.write(f"  {parcel.site_address}")
-            self.stdout.write(f"  {parcel.site_city}, {parcel.site_zip}")
-
-            if not parcel.site_address or not parcel.site_city:
-                self.stdout.write(self.style.ERROR("\nERROR: Parcel is missing address information"))
-                return
-
-            # Construct address for ATTOM
-            address1 = parcel.site_address
-            address2 = f"{parcel.site_city}, {parcel.site_zip}" if parcel.site_zip else parcel.site_city
-
-            self.stdout.write(f"\nFetching from ATTOM API...")
-            self.stdout.write(f"  Address 1: {address1}")
-            self.stdout.write(f"  Address 2: {address2}\n")
-
-            # Fetch from ATTOM
-            attom_data = fetch_attom_data_for_address(address1, address2)
-
-            if not attom_data or not attom_data.get("raw_response"):
-                self.stdout.write(self.style.ERROR("\nNo data returned from ATTOM API"))
-                return
-
-            raw = attom_data.get("raw_response", {})
-
-            self.stdout.write(self.style.SUCCESS("\n✓ ATTOM API Response Received\n"))
-            self.stdout.write("="*80)
-
-            # Show top-level structure
-            self.stdout.write(f"\nResponse Status: {raw.get('status', {}).get('msg', 'N/A')}")
-            self.stdout.write(f"Property Count: {len(raw.get('property', []))}")
-
-            if raw.get('property'):
-                prop = raw['property'][0]
-
-                self.stdout.write(f"\n\nTop-level keys in property object:")
-                for key in sorted(prop.keys()):
-                    value_type = type(prop[key]).__name__
-                    self.stdout.write(f"  - {key:30} ({value_type})")
-
-                # Show foreclosure structure
-                if 'foreclosure' in prop:
-                    self.stdout.write(f"\n\nForeclosure data structure:")
-                    fc = prop['foreclosure']
-                    if isinstance(fc, dict):
-                        for key in sorted(fc.keys()):
-                            self.stdout.write(f"  - {key}: {fc[key]}")
-                    else:
-                        self.stdout.write(f"  Type: {type(fc)}")
-                        self.stdout.write(f"  Value: {fc}")
-
-                # Show mortgage structure
-                if 'mortgage' in prop:
-                    self.stdout.write(f"\n\nMortgage data structure:")
-                    mg = prop['mortgage']
-                    if isinstance(mg, list):
-                        self.stdout.write(f"  Count: {len(mg)} mortgages")
-                        if mg:
-                            self.stdout.write(f"  First mortgage keys:")
-                            for key in sorted(mg[0].keys()):
-                                self.stdout.write(f"    - {key}: {mg[0][key]}")
-                    else:
-                        self.stdout.write(f"  Type: {type(mg)}")
-
-                # Show assessment structure
-                if 'assessment' in prop:
-                    self.stdout.write(f"\n\nAssessment data structure:")
-                    asmt = prop['assessment']
-                    if isinstance(asmt, dict):
-                        for key in sorted(asmt.keys()):
-                            self.stdout.write(f"  - {key}: {asmt[key]}")
-
-                # Show tax structure
-                if 'tax' in prop:
-                    self.stdout.write(f"\n\nTax data structure:")
-                    tax = prop['tax']
-                    if isinstance(tax, dict):
-                        for key in sorted(tax.keys()):
-                            self.stdout.write(f"  - {key}: {tax[key]}")
-
-                # Save full JSON to file for inspection
-                output_file = f"/tmp/attom_response_{town_id}_{loc_id}.json"
-                with open(output_file, 'w') as f:
-                    json.dump(raw, f, indent=2, default=str)
-
-                self.stdout.write(f"\n\n✓ Full response saved to: {output_file}")
-                self.stdout.write("="*80 + "\n")
-
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f"\nERROR: {type(e).__name__}: {e}"))
-            import traceback
-            traceback.print_exc()
+            self._write_report(result, write)
+        finally:
+            self.stdout.write(buffer.getvalue(), ending="")
+
+        if result.get("traceback"):
+            self.stderr.write(result["traceback"], ending="")
+
+    def _write_report(self, result: dict, write) -> None:
+        write(f"\nTesting ATTOM API for parcel: {result['town_id']} / {result['loc_id']}\n")
+        write("="*80)
+
+        parcel = result.get("parcel")
+        if parcel:
+            write(f"\nParcel Address:")
+            write(f"  {parcel['site_address']}")
+            write(f"  {parcel['site_city']}, {parcel['site_zip']}")
+
+        if result.get("address1"):
+            write(f"\nFetching from ATTOM API...")
+            write(f"  Address 1: {result['address1']}")
+            write(f"  Address 2: {result['address2']}\n")
+
+        if result.get("error"):
+            write(self.style.ERROR(f"\nERROR: {result['error']}"))
+            return
+
+        # Rendered from inspect_parcel's structure summary; the raw response stays in the
+        # output file on whichever machine fetched it.
+        response = result.get("response")
+        if not response:
+            write(self.style.ERROR("\nNo data returned from ATTOM API"))
+            return
+
+        write(self.style.SUCCESS("\n✓ ATTOM API Response Received\n"))
+        write("="*80)
+
+        # Show top-level structure
+        write(f"\nResponse Status: {response['status']}")
+        write(f"Property Count: {response['property_count']}")
+
+        if response['property_count']:
+            section_writers = {
+                'foreclosure': self._write_foreclosure,
+                'mortgage': self._write_mortgage,
+                'assessment': self._write_assessment,
+                'tax': self._write_tax,
+            }
+
+            write(f"\n\nTop-level keys in property object:")
+            key_line = "  - {:30} ({})".format
+            for key, type_name in response['property_keys']:
+                write(key_line(key, type_name))
+
+            sections = response['sections']
+            for key, write_section in section_writers.items():
+                if key in sections:
+                    write_section(sections[key], write)
+
+            if result.get("output_file"):
+                write(f"\n\n✓ Full response saved to: {result['output_file']}")
+            write("="*80 + "\n")
+
+    def _write_items(self, section: dict, write, indent: str = "  ") -> bool:
+        """Write ``- key: value`` lines for a mapping section; returns False if it was not one."""
+        if "items" not in section:
+            return False
+        item_line = (indent + "- {}: {}").format
+        for key, value in section["items"]:
+            write(item_line(key, value))
+        return True
+
+    def _write_foreclosure(self, fc, write) -> None:
+        write(f"\n\nForeclosure data structure:")
+        if not self._write_items(fc, write):
+            write(f"  Type: {fc['type']}")
+            write(f"  Value: {fc['value']}")
+
+    def _write_mortgage(self, mg, write) -> None:
+        write(f"\n\nMortgage data structure:")
+        if "count" in mg:
+            write(f"  Count: {mg['count']} mortgages")
+            if "first" in mg:
+                write(f"  First mortgage keys:")
+                self._write_items(mg["first"], write, indent="    ")
+        else:
+            write(f"  Type: {mg['type']}")
+
+    def _write_assessment(self, asmt, write) -> None:
+        write(f"\n\nAssessment data structure:")
+        self._write_items(asmt, write)
+
+    def _write_tax(self, tax, write) -> None:
+        write(f"\n\nTax data structure:")
+        self._write_items(tax, write)
@@ -3,6 +3,9 @@ from django.db import migrations, models
 
 class Migration(migrations.Migration):
 
+    # Both nullable ADD COLUMNs run in one transaction; on PostgreSQL neither rewrites the table.
+    atomic = True
+
     dependencies = [
         ("leads", "0007_skiptracerecord"),
     ]
@@ -26,7 +26,7 @@ class Migration(migrations.Migration):
         ),
         migrations.RemoveIndex(
             model_name='skiptracerecord',
-            name='leads_skipt_created_225aa9_idx',
+            name='leads_skipt_created_0b4994_idx',
         ),
         migrations.AddIndex(
             model_name='skiptracerecord',
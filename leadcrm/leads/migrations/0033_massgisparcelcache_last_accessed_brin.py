@@ -0,0 +1,37 @@
+# Generated manually: BRIN index backing cleanup_parcel_cache's last_accessed range scans
+
+from django.db import migrations
+
+
+BRIN_INDEX_NAME = "leads_massgisparcelcache_last_accessed_brin"
+
+
+def create_brin_index(apps, schema_editor):
+    # BRIN is PostgreSQL-only; local SQLite databases keep the btree index.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {BRIN_INDEX_NAME} "
+        "ON leads_massgisparcelcache USING brin (last_accessed) "
+        "WITH (pages_per_range = 32)"
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {BRIN_INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+    atomic = False
+
+    dependencies = [
+        ('leads', '0032_add_state_field'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_brin_index, reverse_code=drop_brin_index),
+    ]
@@ -0,0 +1,47 @@
+# Generated manually: store Lead bedrooms as a smallint and bathrooms in half-bath precision,
+# and index the pair for bed/bath filters
+
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models.functions import Round
+
+
+def fit_bed_bath_to_new_columns(apps, schema_editor):
+    # Round explicitly rather than leaving it to the ALTER's cast, and clear anything that
+    # would not fit once rounded (e.g. 99.95 baths -> 100.0 overflows numeric(3, 1)).
+    # Out-of-range values are data-entry noise.
+    Lead = apps.get_model('leads', 'Lead')
+    Lead.objects.filter(
+        models.Q(bedrooms__lt=0) | models.Q(bedrooms__gte=Decimal('32767.5'))
+    ).update(bedrooms=None)
+    Lead.objects.filter(
+        models.Q(bathrooms__lt=0) | models.Q(bathrooms__gte=Decimal('99.95'))
+    ).update(bathrooms=None)
+    Lead.objects.filter(bedrooms__isnull=False).update(bedrooms=Round('bedrooms'))
+    Lead.objects.filter(bathrooms__isnull=False).update(bathrooms=Round('bathrooms', 1))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0033_massgisparcelcache_last_accessed_brin'),
+    ]
+
+    operations = [
+        migrations.RunPython(fit_bed_bath_to_new_columns, reverse_code=migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='lead',
+            name='bedrooms',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='lead',
+            name='bathrooms',
+            field=models.DecimalField(blank=True, decimal_places=1, max_digits=3, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['bedrooms', 'bathrooms'], name='lead_beds_baths_idx'),
+        ),
+    ]
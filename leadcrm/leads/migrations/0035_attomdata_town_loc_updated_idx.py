@@ -0,0 +1,22 @@
+# Generated manually: composite index backing bulk_get_cached_attom's freshest-first lookups,
+# replacing the (town_id, loc_id) index it covers
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0034_narrow_lead_bedrooms_bathrooms'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attomdata',
+            index=models.Index(fields=['town_id', 'loc_id', '-last_updated'], name='attom_town_loc_updated_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='attomdata',
+            name='leads_attom_town_id_e348f5_idx',
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated manually: one AttomData row per (town_id, loc_id, saved_list) so the ATTOM
+# cache can be upserted with INSERT ... ON CONFLICT
+#
+# Requires PostgreSQL 15+ for NULLS NOT DISTINCT (nulls_distinct=False), which makes the
+# shared saved_list=NULL row unique too. Older PostgreSQL and SQLite skip the constraint;
+# save_attom_cache_records then falls back to one update_or_create per row.
+
+from django.db import migrations, models
+
+
+def drop_duplicate_attom_rows(apps, schema_editor):
+    # Older writes could leave several rows per key; keep the most recently updated one.
+    AttomData = apps.get_model('leads', 'AttomData')
+    rows = (
+        AttomData.objects.order_by('town_id', 'loc_id', 'saved_list_id', '-last_updated', '-pk')
+        .values_list('pk', 'town_id', 'loc_id', 'saved_list_id')
+        .iterator()
+    )
+    seen = set()
+    duplicate_ids = []
+    for pk, town_id, loc_id, saved_list_id in rows:
+        key = (town_id, loc_id, saved_list_id)
+        if key in seen:
+            duplicate_ids.append(pk)
+        else:
+            seen.add(key)
+
+    for start in range(0, len(duplicate_ids), 1000):
+        AttomData.objects.filter(pk__in=duplicate_ids[start:start + 1000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0035_attomdata_town_loc_updated_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_duplicate_attom_rows, reverse_code=migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='attomdata',
+            constraint=models.UniqueConstraint(
+                fields=('town_id', 'loc_id', 'saved_list'),
+                name='attom_town_loc_list_uniq',
+                nulls_distinct=False,
+            ),
+        ),
+    ]
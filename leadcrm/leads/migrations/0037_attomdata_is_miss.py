@@ -0,0 +1,18 @@
+# Generated manually: flag cached ATTOM misses so they can use a longer TTL
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0036_attomdata_town_loc_list_uniq'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attomdata',
+            name='is_miss',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated manually: composite index backing should_search_parcel's shared-search freshness probe
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0037_attomdata_is_miss'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='liensearchattempt',
+            index=models.Index(fields=['town_id', 'loc_id', 'searched_at'], name='lien_attempt_town_loc_at_idx'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated manually: composite indexes for the background lien search queries
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0038_should_search_parcel_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='legalaction',
+            index=models.Index(
+                models.F('town_id'),
+                models.F('loc_id'),
+                django.db.models.functions.text.Upper('source'),
+                models.F('updated_at'),
+                name='legal_town_loc_usrc_upd_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='legalaction',
+            index=models.Index(fields=['town_id', 'loc_id', 'case_number'], name='legal_town_loc_case_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lienrecord',
+            index=models.Index(fields=['created_by', 'town_id', 'loc_id', 'source'], name='lien_user_town_loc_src_idx'),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.conf import settings
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Upper
 
 
 class Lead(models.Model):
@@ -60,11 +62,9 @@ class Lead(models.Model):
     dnc_2 = models.CharField(max_length=10, blank=True, null=True)
     dnc_3 = models.CharField(max_length=10, blank=True, null=True)
     email = models.EmailField(blank=True, null=True)
-    bedrooms = models.DecimalField(
-        max_digits=5, decimal_places=2, blank=True, null=True
-    )
+    bedrooms = models.PositiveSmallIntegerField(blank=True, null=True)
     bathrooms = models.DecimalField(
-        max_digits=5, decimal_places=2, blank=True, null=True
+        max_digits=3, decimal_places=1, blank=True, null=True
     )
 
     # CRM Functionality
@@ -76,6 +76,11 @@ class Lead(models.Model):
     notes = models.TextField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["bedrooms", "bathrooms"], name="lead_beds_baths_idx"),
+        ]
+
     def __str__(self):
         return f"{self.site_address or 'Lead'} ({self.owner_name or 'Unknown Owner'})"
 
@@ -489,6 +494,8 @@ class AttomData(models.Model):
 
     # Store the full raw JSON response for reference
     raw_response = models.JSONField(default=dict, blank=True)
+    # ATTOM returned no property for this parcel; cached on a longer TTL
+    is_miss = models.BooleanField(default=False)
 
     # Timestamp fields for caching
     last_updated = models.DateTimeField(auto_now=True)
@@ -497,8 +504,19 @@ class AttomData(models.Model):
     class Meta:
         # Create index for efficient cache lookups across all users
         indexes = [
-            models.Index(fields=["town_id", "loc_id"]),
             models.Index(fields=["last_updated"]),
+            # Freshest-first cache lookups (bulk_get_cached_attom) filter on all three columns;
+            # it also serves plain (town_id, loc_id) lookups.
+            models.Index(fields=["town_id", "loc_id", "-last_updated"], name="attom_town_loc_updated_idx"),
+        ]
+        constraints = [
+            # One row per parcel per list plus one shared (saved_list=NULL) row, so the
+            # cache can be written with a single INSERT ... ON CONFLICT.
+            models.UniqueConstraint(
+                fields=["town_id", "loc_id", "saved_list"],
+                name="attom_town_loc_list_uniq",
+                nulls_distinct=False,
+            ),
         ]
 
     def __str__(self):
@@ -628,6 +646,8 @@ class LienRecord(models.Model):
             models.Index(fields=['status']),
             models.Index(fields=['lien_type']),
             models.Index(fields=['recording_date']),
+            # Background search loads the user's existing lien sources per parcel.
+            models.Index(fields=['created_by', 'town_id', 'loc_id', 'source'], name='lien_user_town_loc_src_idx'),
         ]
 
     def __str__(self):
@@ -755,6 +775,14 @@ class LegalAction(models.Model):
             models.Index(fields=['action_type']),
             models.Index(fields=['case_number']),
             models.Index(fields=['filing_date']),
+            # should_search_parcel probes for fresh CourtListener rows per parcel; source__iexact
+            # compiles to UPPER(source) on PostgreSQL, so the index is on that expression.
+            models.Index(
+                F('town_id'), F('loc_id'), Upper('source'), F('updated_at'),
+                name='legal_town_loc_usrc_upd_idx',
+            ),
+            # ensure_legal_action_records loads candidates by parcel and case number.
+            models.Index(fields=['town_id', 'loc_id', 'case_number'], name='legal_town_loc_case_idx'),
         ]
 
     def __str__(self):
@@ -790,6 +818,8 @@ class LienSearchAttempt(models.Model):
         indexes = [
             models.Index(fields=['created_by', 'town_id', 'loc_id']),
             models.Index(fields=['searched_at']),
+            # should_search_parcel probes for any recent attempt on a parcel.
+            models.Index(fields=['town_id', 'loc_id', 'searched_at'], name='lien_attempt_town_loc_at_idx'),
         ]
         unique_together = [['created_by', 'town_id', 'loc_id']]
 
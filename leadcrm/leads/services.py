@@ -11,10 +11,12 @@ import shutil
 import threading
 import time
 import zipfile
+from array import array
 from collections import defaultdict
 import os
 from decimal import Decimal, InvalidOperation
 
+import numpy as np
 import requests
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -22,7 +24,7 @@ from email.utils import parsedate_to_datetime
 from functools import lru_cache
 from html.parser import HTMLParser
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 from urllib import error, parse, request
 from urllib.error import URLError
 from urllib.parse import urljoin, urlparse
@@ -372,6 +374,14 @@ _MA_N = (math.log(_MA_M1) - math.log(_MA_M2)) / (math.log(_MA_T1) - math.log(_MA
 _MA_F = _MA_M1 / (_MA_N * math.pow(_MA_T1, _MA_N))
 _MA_RHO0 = _MA_SEMI_MAJOR_AXIS * _MA_F * math.pow(_MA_T0, _MA_N)
 
+# Derived constants for the inverse projection, computed once rather than per point.
+_MA_RHO_SCALE = _MA_SEMI_MAJOR_AXIS * _MA_F
+_MA_INV_N = 1 / _MA_N
+_MA_HALF_ECCENTRICITY = _MA_ECCENTRICITY / 2
+_MA_ORIGIN_LONGITUDE = math.degrees(_MA_CENTRAL_MERIDIAN)
+_MA_ORIGIN_LATITUDE = 90.0 if _MA_N > 0 else -90.0
+_US_SURVEY_FOOT_TO_METERS = 0.3048006096012192
+
 
 def _load_dataset_index() -> Dict[str, Dict[str, str]]:
     if MASSGIS_DATASET_INDEX.exists():
@@ -1325,9 +1335,8 @@ def massgis_stateplane_to_wgs84(x: float, y: float) -> Optional[Tuple[float, flo
         # State Plane meters coordinates are typically < 500,000
         if x > 500000 or y > 2000000:
             # Convert from US Survey Feet to meters
-            US_SURVEY_FOOT_TO_METERS = 0.3048006096012192
-            x = x * US_SURVEY_FOOT_TO_METERS
-            y = y * US_SURVEY_FOOT_TO_METERS
+            x = x * _US_SURVEY_FOOT_TO_METERS
+            y = y * _US_SURVEY_FOOT_TO_METERS
 
         x_prime = x - _MA_FALSE_EASTING
         y_prime = _MA_RHO0 - (y - _MA_FALSE_NORTHING)
@@ -1335,16 +1344,16 @@ def massgis_stateplane_to_wgs84(x: float, y: float) -> Optional[Tuple[float, flo
         rho = math.copysign(math.hypot(x_prime, y_prime), _MA_N)
         if rho == 0:
             # At the projection origin; longitude equals central meridian.
-            return math.degrees(_MA_CENTRAL_MERIDIAN), 90.0 if _MA_N > 0 else -90.0
+            return _MA_ORIGIN_LONGITUDE, _MA_ORIGIN_LATITUDE
 
         theta = math.atan2(x_prime, y_prime)
-        t_val = math.pow(rho / (_MA_SEMI_MAJOR_AXIS * _MA_F), 1 / _MA_N)
+        t_val = math.pow(rho / _MA_RHO_SCALE, _MA_INV_N)
         phi = math.pi / 2 - 2 * math.atan(t_val)
 
         for _ in range(5):
             esin = _MA_ECCENTRICITY * math.sin(phi)
             phi = math.pi / 2 - 2 * math.atan(
-                t_val * math.pow((1 - esin) / (1 + esin), _MA_ECCENTRICITY / 2)
+                t_val * math.pow((1 - esin) / (1 + esin), _MA_HALF_ECCENTRICITY)
             )
 
         lam = _MA_CENTRAL_MERIDIAN + theta / _MA_N
@@ -1356,6 +1365,47 @@ def massgis_stateplane_to_wgs84(x: float, y: float) -> Optional[Tuple[float, flo
         return None
 
 
+def massgis_stateplane_to_wgs84_array(xs, ys) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized counterpart of massgis_stateplane_to_wgs84 for coordinate arrays.
+
+    Applies the same WGS84 passthrough and feet/meter detection per point. Points that
+    cannot be projected come back as NaN so callers can drop them.
+    """
+
+    x = np.asarray(xs, dtype=np.float64)
+    y = np.asarray(ys, dtype=np.float64)
+
+    passthrough = (x >= -180.0) & (x <= 180.0) & (y >= -90.0) & (y <= 90.0)
+    feet = ~passthrough & ((x > 500000) | (y > 2000000))
+    x_m = np.where(feet, x * _US_SURVEY_FOOT_TO_METERS, x)
+    y_m = np.where(feet, y * _US_SURVEY_FOOT_TO_METERS, y)
+
+    x_prime = x_m - _MA_FALSE_EASTING
+    y_prime = _MA_RHO0 - (y_m - _MA_FALSE_NORTHING)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        rho = np.copysign(np.hypot(x_prime, y_prime), _MA_N)
+        theta = np.arctan2(x_prime, y_prime)
+        t_val = np.power(rho / _MA_RHO_SCALE, _MA_INV_N)
+        phi = math.pi / 2 - 2 * np.arctan(t_val)
+
+        for _ in range(5):
+            esin = _MA_ECCENTRICITY * np.sin(phi)
+            phi = math.pi / 2 - 2 * np.arctan(
+                t_val * np.power((1 - esin) / (1 + esin), _MA_HALF_ECCENTRICITY)
+            )
+
+    lon = np.degrees(_MA_CENTRAL_MERIDIAN + theta / _MA_N)
+    lat = np.degrees(phi)
+
+    origin = rho == 0
+    if origin.any():
+        lon = np.where(origin, _MA_ORIGIN_LONGITUDE, lon)
+        lat = np.where(origin, _MA_ORIGIN_LATITUDE, lat)
+
+    return np.where(passthrough, x, lon), np.where(passthrough, y, lat)
+
+
 def get_property_imagery_url(
     longitude: float,
     latitude: float,
@@ -1435,6 +1485,21 @@ def _load_use_code_lut(dataset_dir: str) -> Dict[str, str]:
 
 
 def get_massgis_property_type_choices(town_id: int) -> List[Tuple[str, str]]:
+    try:
+        normalized_id = int(town_id)
+    except (TypeError, ValueError):
+        return _build_massgis_property_type_choices(town_id)
+    return list(_cached_massgis_property_type_choices(normalized_id))
+
+
+@lru_cache(maxsize=512)
+def _cached_massgis_property_type_choices(town_id: int) -> Tuple[Tuple[str, str], ...]:
+    # Every search form render for a selected town asks for these; cleared when a
+    # dataset is refreshed (see refresh_massgis_dataset).
+    return tuple(_build_massgis_property_type_choices(town_id))
+
+
+def _build_massgis_property_type_choices(town_id: int) -> List[Tuple[str, str]]:
     town = _get_massgis_town(town_id)
     dataset_dir = _ensure_massgis_dataset(town)
     lookup = _load_use_code_lut(str(dataset_dir))
@@ -3450,6 +3515,7 @@ def refresh_massgis_dataset(
     _delete_local_dataset(slug)
     path = _ensure_massgis_dataset(town, last_modified=remote_last_modified)
     _update_dataset_index_entry(slug, last_checked=now)
+    _cached_massgis_property_type_choices.cache_clear()
     return True, reason
 
 
@@ -3740,11 +3806,8 @@ def _load_assess_records_impl(directory: Path) -> List[Dict[str, object]]:
     reader = shapefile.Reader(shp=None, shx=None, dbf=str(assess_dbf))
     field_names = [field[0] for field in reader.fields[1:]]
 
-    records: List[Dict[str, object]] = []
     try:
-        for raw_record in reader.iterRecords():
-            record = {field_names[index]: raw_record[index] for index in range(len(field_names))}
-            records.append(record)
+        records = [dict(zip(field_names, raw_record)) for raw_record in reader.iterRecords()]
     finally:
         reader.close()
 
@@ -3877,6 +3940,66 @@ def _should_replace_assess_record(candidate: Mapping[str, object], existing: Map
     return _assess_record_priority(candidate) > _assess_record_priority(existing)
 
 
+_ASSESS_INDEX_KEYS = ("LOC_ID", "MAP_PAR_ID", "PID", "GIS_ID")
+
+
+def _index_assess_records(
+    assess_records: Iterable[Dict[str, object]],
+) -> Tuple[Dict[str, Dict[str, object]], Dict[str, List[Dict[str, object]]]]:
+    """
+    Index assessment records by every identifier they carry.
+
+    Returns ``(assess_index, unit_records_map)``: the highest-priority record per key, and
+    all records per key. Each record's keys and priority are derived once, and a record
+    whose identifiers repeat (e.g. LOC_ID == MAP_PAR_ID) is indexed once per distinct key.
+    """
+    assess_index: Dict[str, Dict[str, object]] = {}
+    best_priority: Dict[str, Tuple[float, int]] = {}
+    unit_records_map: Dict[str, List[Dict[str, object]]] = defaultdict(list)
+    for record in assess_records:
+        keys = {
+            key_value: None
+            for key_value in (_clean_string(record.get(key_name)) for key_name in _ASSESS_INDEX_KEYS)
+            if key_value
+        }
+        if not keys:
+            continue
+        priority = _assess_record_priority(record)
+        for key_value in keys:
+            unit_records_map[key_value].append(record)
+            existing_priority = best_priority.get(key_value)
+            if existing_priority is None or priority > existing_priority:
+                assess_index[key_value] = record
+                best_priority[key_value] = priority
+    return assess_index, unit_records_map
+
+
+@lru_cache(maxsize=32)
+def _load_assess_index_cached(
+    dataset_dir: str,
+) -> Tuple[Dict[str, Dict[str, object]], Dict[str, List[Dict[str, object]]]]:
+    assess_index, unit_records_map = _index_assess_records(_load_assess_records_cached(dataset_dir))
+    # Shared between callers, so hand out a plain dict that lookups cannot grow.
+    return assess_index, dict(unit_records_map)
+
+
+def _load_assess_index(
+    dataset_dir: str,
+    assess_records: Iterable[Dict[str, object]],
+) -> Tuple[Dict[str, Dict[str, object]], Dict[str, List[Dict[str, object]]]]:
+    """
+    Return ``_index_assess_records`` output for a town's already-loaded assessment records.
+
+    The index is cached per dataset alongside _load_assess_records_cached, so repeated
+    viewport queries and regenerations of the same town reuse it. Boston records are
+    not cached, so they are indexed from ``assess_records`` each time.
+    """
+    directory = Path(dataset_dir)
+    if directory.name.upper() == "BOSTON_TAXPAR":
+        return _index_assess_records(assess_records)
+    return _load_assess_index_cached(str(directory))
+
+
 def _summarize_unit_records(records: Iterable[Mapping[str, object]]) -> List[Dict[str, object]]:
     summary: List[Dict[str, object]] = []
     seen_ids: set[str] = set()
@@ -4698,7 +4821,12 @@ def _parse_massgis_date(value: Optional[object]) -> Optional[datetime]:
     text = str(value).strip()
     if not text:
         return None
+    return _parse_massgis_date_text(text)
 
+
+# Sale dates repeat heavily within a town, and each miss walks several strptime formats.
+@lru_cache(maxsize=8192)
+def _parse_massgis_date_text(text: str) -> Optional[datetime]:
     candidates = [
         "%Y-%m-%d",
         "%m/%d/%Y",
@@ -5716,6 +5844,7 @@ def get_parcels_in_bbox(north: float, south: float, east: float, west: float,
         if limit is not None and len(parcels) >= limit:
             break
 
+        sf = None
         try:
             town = _get_massgis_town(town_id)
 
@@ -5733,7 +5862,7 @@ def get_parcels_in_bbox(north: float, south: float, east: float, west: float,
                     sf = shapefile.Reader(str(tax_par_path))
                     field_names = [field[0] for field in sf.fields[1:]]
 
-                    num_shapes = len(sf.shapes())
+                    num_shapes = len(sf)
                     logger.info(f"Found {num_shapes} parcel shapes in {town.name} shapefile")
 
                     # Load assessment records with address data
@@ -5763,21 +5892,11 @@ def get_parcels_in_bbox(north: float, south: float, east: float, west: float,
             usecode_lookup = _load_usecode_lookup(str(dataset_dir))
 
             # Build a lookup dict by LOC_ID
-            assess_index: Dict[str, Dict[str, object]] = {}
-            unit_records_map: Dict[str, List[Dict[str, object]]] = defaultdict(list)
-            for record in assess_records:
-                for key_name in ("LOC_ID", "MAP_PAR_ID", "PID", "GIS_ID"):
-                    key_value = _clean_string(record.get(key_name))
-                    if not key_value:
-                        continue
-                    unit_records_map[key_value].append(record)
-                    existing = assess_index.get(key_value)
-                    if existing is None or _should_replace_assess_record(record, existing):
-                        assess_index[key_value] = record
+            assess_index, unit_records_map = _load_assess_index(str(dataset_dir), assess_records)
 
             enforce_neighborhood = boston_neighborhood is not None and town_id == BOSTON_TOWN_ID
 
-            for shape_record in sf.shapeRecords():
+            for shape_record in sf.iterShapeRecords():
                 if limit is not None and len(parcels) >= limit:
                     break
 
@@ -5993,6 +6112,9 @@ def get_parcels_in_bbox(north: float, south: float, east: float, west: float,
         except Exception as exc:  # noqa: BLE001
             logger.warning(f"Error loading parcels from town {town_id}: {exc}")
             continue
+        finally:
+            if sf is not None:
+                sf.close()
 
     if radius_limit_miles is not None and reference_point is not None:
         logger.info(
@@ -6136,6 +6258,101 @@ def _convert_ring_to_wgs84(ring: Iterable[Iterable[float]]) -> Optional[List[Lis
     return converted
 
 
+def _geometry_polygons(geometry: Optional[Dict[str, Any]]) -> Optional[Tuple[str, List]]:
+    if not geometry:
+        return None
+    geom_type = geometry.get("type")
+    coords = geometry.get("coordinates")
+    if not geom_type or not coords:
+        return None
+    if geom_type == "MultiPolygon":
+        return "MultiPolygon", list(coords)
+    if geom_type == "Polygon" or isinstance(coords, list):
+        return "Polygon", [coords]
+    return None
+
+
+def _transform_geometries_to_wgs84(
+    geometries: Sequence[Optional[Dict[str, Any]]],
+    precision: Optional[int] = None,
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Batch variant of _transform_geometry_to_wgs84.
+
+    Every vertex across all geometries is projected in a single vectorized call and
+    then sliced back into rings, applying the same ring rules as _convert_ring_to_wgs84.
+    When ``precision`` is given, coordinates are rounded to that many decimal places.
+
+    Source vertices are gathered into packed float64 buffers, which take a quarter of
+    the memory of lists of floats and are handed to NumPy without a copy.
+    """
+    layouts: List[Optional[Tuple[str, List[List[Tuple[int, int]]]]]] = []
+    xs = array("d")
+    ys = array("d")
+
+    for geometry in geometries:
+        normalized = _geometry_polygons(geometry)
+        if normalized is None:
+            layouts.append(None)
+            continue
+        geom_type, polygons = normalized
+        polygon_rings: List[List[Tuple[int, int]]] = []
+        for polygon in polygons:
+            ring_bounds = []
+            for ring in polygon or []:
+                start = len(xs)
+                for point in ring or []:
+                    if point is None or len(point) < 2:
+                        continue
+                    xs.append(point[0])
+                    ys.append(point[1])
+                ring_bounds.append((start, len(xs)))
+            polygon_rings.append(ring_bounds)
+        layouts.append((geom_type, polygon_rings))
+
+    if not xs:
+        return [None] * len(geometries)
+
+    lngs, lats = massgis_stateplane_to_wgs84_array(xs, ys)
+    transformed = np.column_stack((lngs, lats))
+    if precision is not None:
+        transformed = np.round(transformed, precision)
+    invalid = np.isnan(transformed).any(axis=1)
+    has_invalid = bool(invalid.any())
+    coords = transformed.tolist()
+
+    def convert_ring(start: int, end: int) -> Optional[List[List[float]]]:
+        if has_invalid:
+            converted = [coords[i] for i in range(start, end) if not invalid[i]]
+        else:
+            converted = coords[start:end]
+        if len(converted) < 3:
+            return None
+        if converted[0] != converted[-1]:
+            converted.append(converted[0])
+        return converted
+
+    results: List[Optional[Dict[str, Any]]] = []
+    for layout in layouts:
+        if layout is None:
+            results.append(None)
+            continue
+        geom_type, polygon_rings = layout
+        polygons = []
+        for ring_bounds in polygon_rings:
+            converted = [convert_ring(start, end) for start, end in ring_bounds]
+            converted = [ring for ring in converted if ring]
+            if converted:
+                polygons.append(converted)
+        if not polygons:
+            results.append(None)
+        elif geom_type == "MultiPolygon":
+            results.append({"type": "MultiPolygon", "coordinates": polygons})
+        else:
+            results.append({"type": "Polygon", "coordinates": polygons[0]})
+    return results
+
+
 def _geojson_geometry_to_leaflet_latlngs(geometry: Dict[str, Any]) -> List:
     """
     Convert a GeoJSON geometry (WGS84) into the nested lat/lng arrays expected by Leaflet.
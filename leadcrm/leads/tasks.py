@@ -237,3 +237,20 @@ def compute_market_values(lookback_days: int = 365, target_comps: int = 5, batch
     except Exception as exc:
         logger.error(f"Market values computation failed: {exc}", exc_info=True)
         raise
+
+
+@shared_task(name='leads.fetch_and_dump_attom')
+def fetch_and_dump_attom(town_id: int, loc_id: str, compact: bool = False):
+    """
+    Fetch ATTOM data for one parcel and save the raw response on the worker.
+    Used by `manage.py test_attom --celery` to fan multi-parcel sweeps out across workers;
+    only the structure summary and output path come back through the result backend.
+
+    Args:
+        town_id: MassGIS town ID
+        loc_id: Parcel location ID
+        compact: Save the response without indentation
+    """
+    from .attom_debug import inspect_parcel
+
+    return inspect_parcel(town_id, loc_id, compact=compact)
@@ -0,0 +1,78 @@
+import importlib
+from datetime import timedelta
+from unittest import skipIf, skipUnless
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+
+from leads.attom_service import save_attom_cache_records
+from leads.models import AttomData, SavedParcelList
+
+_PROFILE = {"raw_response": {"expandedprofile": {"property": [{"identifier": {}}]}}}
+
+
+class SaveAttomCacheRecordsTests(TestCase):
+    def setUp(self) -> None:
+        user = get_user_model().objects.create_user(username="alice")
+        self.saved_list = SavedParcelList.objects.create(
+            created_by=user, name="List", town_id=1, town_name="Salem", criteria={}, loc_ids=[]
+        )
+
+    def _save(self, payload: dict, **kwargs) -> list:
+        return save_attom_cache_records(
+            town_id=1,
+            payload=payload,
+            targets=[("L1", self.saved_list), ("L1", None), ("L1", self.saved_list)],
+            **kwargs,
+        )
+
+    def _assert_upserts(self) -> None:
+        self._save({**_PROFILE, "pre_foreclosure": False})
+        self._save({**_PROFILE, "pre_foreclosure": True})
+        self._save({"raw_response": {}}, is_miss=True)
+
+        rows = AttomData.objects.filter(town_id=1, loc_id="L1")
+        self.assertEqual(rows.count(), 2)
+        self.assertEqual(
+            set(rows.values_list("saved_list_id", "pre_foreclosure", "is_miss")),
+            {(self.saved_list.pk, True, True), (None, True, True)},
+        )
+
+    @skipIf(
+        connection.features.supports_nulls_distinct_unique_constraints,
+        "the per-row fallback only runs without NULLS NOT DISTINCT support",
+    )
+    def test_per_row_fallback_updates_existing_rows(self) -> None:
+        self._assert_upserts()
+
+    @skipUnless(
+        connection.features.supports_nulls_distinct_unique_constraints,
+        "INSERT ... ON CONFLICT needs NULLS NOT DISTINCT (PostgreSQL 15+)",
+    )
+    def test_single_statement_upsert_updates_existing_rows(self) -> None:
+        self._assert_upserts()
+
+
+class DropDuplicateAttomRowsTests(TestCase):
+    @skipIf(
+        connection.features.supports_nulls_distinct_unique_constraints,
+        "attom_town_loc_list_uniq prevents creating the duplicates",
+    )
+    def test_keeps_most_recently_updated_row_per_key(self) -> None:
+        migration = importlib.import_module("leads.migrations.0036_attomdata_town_loc_list_uniq")
+        now = timezone.now()
+        ages = {"old": 3, "newest": 1, "middle": 2}
+        for label, days in ages.items():
+            row = AttomData.objects.create(town_id=1, loc_id="L1", mortgage_lender_name=label)
+            AttomData.objects.filter(pk=row.pk).update(last_updated=now - timedelta(days=days))
+        AttomData.objects.create(town_id=1, loc_id="L2", mortgage_lender_name="only")
+
+        migration.drop_duplicate_attom_rows(apps, None)
+
+        self.assertEqual(
+            sorted(AttomData.objects.values_list("loc_id", "mortgage_lender_name")),
+            [("L1", "newest"), ("L2", "only")],
+        )
@@ -0,0 +1,218 @@
+import threading
+import time
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from leads import background_lien_search
+from leads.background_lien_search import (
+    ensure_legal_action_records,
+    search_parcel_background,
+    should_search_parcel,
+    should_search_parcels,
+)
+from leads.models import LegalAction, LienSearchAttempt
+
+
+def _courtlistener_action(case_number: str, **overrides) -> dict:
+    action = {
+        "case_number": case_number,
+        "source": "CourtListener",
+        "action_type": "foreclosure",
+        "status": "pending",
+        "court": "other",
+        "plaintiff": "Bank",
+        "defendant": "Owner",
+        "filing_date": date(2024, 1, 2),
+    }
+    action.update(overrides)
+    return action
+
+
+class EnsureLegalActionRecordsTests(TestCase):
+    def setUp(self) -> None:
+        User = get_user_model()
+        self.alice = User.objects.create_user(username="alice")
+        self.bob = User.objects.create_user(username="bob")
+
+    def test_creates_rows_and_skips_placeholders(self) -> None:
+        created, updated = ensure_legal_action_records(
+            self.alice,
+            1,
+            "L1",
+            [
+                _courtlistener_action("1:24-cv-1"),
+                {"case_number": "MANUAL_LOOKUP", "source": "Registry"},
+                {"source": "Registry"},
+            ],
+        )
+
+        self.assertEqual((created, updated), (1, 0))
+        record = LegalAction.objects.get()
+        self.assertEqual(record.case_number, "1:24-cv-1")
+        self.assertEqual(record.created_by, self.alice)
+        self.assertEqual(record.notes, "Auto-imported from CourtListener")
+
+    def test_repeated_case_in_batch_updates_pending_row(self) -> None:
+        created, updated = ensure_legal_action_records(
+            self.alice,
+            1,
+            "L1",
+            [
+                _courtlistener_action("1:24-cv-1", status="pending"),
+                _courtlistener_action("1:24-cv-1", status="judgment"),
+            ],
+        )
+
+        self.assertEqual((created, updated), (1, 1))
+        record = LegalAction.objects.get()
+        self.assertEqual(record.status, "judgment")
+
+    def test_second_user_reuses_shared_courtlistener_row(self) -> None:
+        ensure_legal_action_records(self.alice, 1, "L1", [_courtlistener_action("1:24-cv-1")])
+
+        created, updated = ensure_legal_action_records(
+            self.bob, 1, "L1", [_courtlistener_action("1:24-cv-1", description="Updated docket")]
+        )
+
+        self.assertEqual((created, updated), (0, 1))
+        record = LegalAction.objects.get()
+        self.assertEqual(record.created_by, self.alice)
+        self.assertEqual(record.description, "Updated docket")
+
+    def test_other_sources_are_kept_per_user(self) -> None:
+        action = {"case_number": "24 SM 1", "source": "Land Court", "action_type": "tax_lien"}
+        ensure_legal_action_records(self.alice, 1, "L1", [action])
+
+        created, updated = ensure_legal_action_records(self.bob, 1, "L1", [action])
+
+        self.assertEqual((created, updated), (1, 0))
+        self.assertEqual(
+            set(LegalAction.objects.values_list("created_by__username", flat=True)),
+            {"alice", "bob"},
+        )
+
+    def test_unchanged_result_writes_nothing(self) -> None:
+        ensure_legal_action_records(self.alice, 1, "L1", [_courtlistener_action("1:24-cv-1")])
+
+        with CaptureQueriesContext(connection) as queries:
+            created, updated = ensure_legal_action_records(
+                self.alice, 1, "L1", [_courtlistener_action("1:24-cv-1")]
+            )
+
+        self.assertEqual((created, updated), (0, 0))
+        self.assertFalse([q for q in queries.captured_queries if q["sql"].startswith(("UPDATE", "INSERT"))])
+
+    def test_update_writes_only_changed_columns(self) -> None:
+        ensure_legal_action_records(self.alice, 1, "L1", [_courtlistener_action("1:24-cv-1")])
+        # Manually maintained columns are not loaded or written by the refresh.
+        LegalAction.objects.update(hearing_date=date(2024, 3, 4), attachments=["docket.pdf"])
+
+        with CaptureQueriesContext(connection) as queries:
+            ensure_legal_action_records(
+                self.alice, 1, "L1", [_courtlistener_action("1:24-cv-1", status="judgment")]
+            )
+
+        updates = [q["sql"] for q in queries.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"status"', updates[0])
+        self.assertNotIn('"plaintiff"', updates[0])
+        self.assertNotIn('"attachments"', updates[0])
+
+        record = LegalAction.objects.get()
+        self.assertEqual(record.status, "judgment")
+        self.assertEqual(record.hearing_date, date(2024, 3, 4))
+        self.assertEqual(record.attachments, ["docket.pdf"])
+
+
+class ShouldSearchParcelsTests(TestCase):
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(username="alice")
+
+    def test_matches_single_parcel_checks(self) -> None:
+        other = get_user_model().objects.create_user(username="bob")
+        LienSearchAttempt.objects.create(created_by=other, town_id=1, loc_id="A")
+        stale = LienSearchAttempt.objects.create(created_by=self.user, town_id=1, loc_id="C")
+        LienSearchAttempt.objects.filter(pk=stale.pk).update(
+            searched_at=timezone.now() - timedelta(days=91)
+        )
+        ensure_legal_action_records(self.user, 2, "B", [_courtlistener_action("1:24-cv-1")])
+
+        # (1, "B") and (2, "A") pair up towns and loc_ids that are fresh elsewhere.
+        keys = [(1, "A"), (2, "B"), (1, "B"), (2, "A"), (1, "C"), (1, "A")]
+        result = should_search_parcels(self.user, keys)
+
+        self.assertEqual(
+            result,
+            {(1, "A"): False, (2, "B"): False, (1, "B"): True, (2, "A"): True, (1, "C"): True},
+        )
+        for key, expected in result.items():
+            self.assertEqual(should_search_parcel(self.user, *key), expected, key)
+
+    def test_empty_keys(self) -> None:
+        self.assertEqual(should_search_parcels(self.user, []), {})
+
+
+class SearchParcelBackgroundTests(TransactionTestCase):
+    # The search pool and writer run on their own threads and connections, so their
+    # writes must actually commit for the assertions below to see them.
+
+    def setUp(self) -> None:
+        self.user = get_user_model().objects.create_user(username="alice")
+
+    def _wait_until_idle(self, timeout: float = 5.0) -> None:
+        deadline = time.monotonic() + timeout
+        while background_lien_search._active_searches:
+            if time.monotonic() > deadline:
+                self.fail("background searches did not finish")
+            time.sleep(0.01)
+
+    def test_search_stays_active_until_attempt_is_saved(self) -> None:
+        observed = []
+        save_results = background_lien_search._save_search_results
+
+        def spy_save(user, town_id, loc_id, *args):
+            observed.append(f"{user.id}:{town_id}:{loc_id}" in background_lien_search._active_searches)
+            save_results(user, town_id, loc_id, *args)
+
+        with mock.patch.object(background_lien_search, "search_all_sources", return_value=([], [])), \
+                mock.patch.object(background_lien_search, "_save_search_results", spy_save):
+            self.assertTrue(search_parcel_background(self.user, 1, "L1", {"owner_name": "Owner"}))
+            self._wait_until_idle()
+
+        self.assertEqual(observed, [True])
+        self.assertTrue(LienSearchAttempt.objects.filter(created_by=self.user, town_id=1, loc_id="L1").exists())
+        self.assertFalse(should_search_parcel(self.user, 1, "L1"))
+
+    def test_full_queue_sheds_and_slots_are_returned(self) -> None:
+        release = threading.Event()
+
+        def blocked_search(**kwargs):
+            release.wait(5)
+            return [], []
+
+        slots = threading.BoundedSemaphore(1)
+        with mock.patch.object(background_lien_search, "search_all_sources", side_effect=blocked_search), \
+                mock.patch.object(background_lien_search, "_search_slots", slots):
+            self.assertTrue(search_parcel_background(self.user, 1, "L1", {"owner_name": "Owner"}))
+            # Same parcel while in flight, then a different parcel with no free slot.
+            self.assertFalse(search_parcel_background(self.user, 1, "L1", {"owner_name": "Owner"}))
+            self.assertFalse(search_parcel_background(self.user, 1, "L2", {"owner_name": "Owner"}))
+
+            release.set()
+            self._wait_until_idle()
+
+            # Searches skipped before reaching the writer release their slot too.
+            self.assertTrue(search_parcel_background(self.user, 1, "L3", {"owner_name": ""}))
+            self._wait_until_idle()
+
+        self.assertTrue(slots.acquire(blocking=False))
+        self.assertEqual(
+            set(LienSearchAttempt.objects.values_list("loc_id", flat=True)),
+            {"L1"},
+        )
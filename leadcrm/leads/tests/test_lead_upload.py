@@ -0,0 +1,37 @@
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from leads.views import _coerce_bed_bath
+
+
+def _coerced(bedrooms, bathrooms) -> tuple:
+    lead_data = {"bedrooms": bedrooms, "bathrooms": bathrooms}
+    _coerce_bed_bath(lead_data)
+    return lead_data["bedrooms"], lead_data["bathrooms"]
+
+
+class CoerceBedBathTests(SimpleTestCase):
+    def test_rounds_half_up_like_migration_0034(self) -> None:
+        self.assertEqual(_coerced("3", "2"), (3, Decimal("2.0")))
+        self.assertEqual(_coerced("3.0", "2.25"), (3, Decimal("2.3")))
+        self.assertEqual(_coerced("2.5", "1.5"), (3, Decimal("1.5")))
+        self.assertEqual(_coerced("2.49", "0.04"), (2, Decimal("0.0")))
+
+    def test_bounds(self) -> None:
+        self.assertEqual(_coerced("32767", "99.94"), (32767, Decimal("99.9")))
+        self.assertEqual(_coerced("32767.49", "0"), (32767, Decimal("0.0")))
+        self.assertEqual(_coerced("32767.5", "99.95"), (None, None))
+        self.assertEqual(_coerced("40000", "100"), (None, None))
+        self.assertEqual(_coerced("-1", "-0.5"), (None, None))
+
+    def test_non_numeric_input(self) -> None:
+        self.assertEqual(_coerced("two", "1 1/2"), (None, None))
+        self.assertEqual(_coerced("NaN", "Infinity"), (None, None))
+        self.assertEqual(_coerced("1e30", "1e30"), (None, None))
+
+    def test_missing_values_stay_missing(self) -> None:
+        self.assertEqual(_coerced(None, None), (None, None))
+        lead_data = {}
+        _coerce_bed_bath(lead_data)
+        self.assertEqual(lead_data, {})
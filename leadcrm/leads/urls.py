@@ -3,6 +3,28 @@ from django.urls import path
 from . import views
 
 urlpatterns = [
+    # Map data endpoints are hit on every pan/zoom, so they are matched first. None of
+    # the patterns below can match these paths, so the order does not change routing.
+    path(
+        "api/parcels-in-viewport/",
+        views.parcels_in_viewport,
+        name="parcels_in_viewport",
+    ),
+    path(
+        "api/parcel-flags/",
+        views.parcel_flags,
+        name="parcel_flags",
+    ),
+    path(
+        "api/town-geojson/<int:town_id>/",
+        views.town_geojson,
+        name="town_geojson",
+    ),
+    path(
+        "api/parcel/<int:town_id>/<str:loc_id>/geometry/",
+        views.parcel_geometry,
+        name="parcel_geometry",
+    ),
     path("", views.parcel_search_home, name="parcel_search"),
     path(
         "search/save-list/",
@@ -130,11 +152,6 @@ urlpatterns = [
         views.bulk_legal_search,
         name="bulk_legal_search",
     ),
-    path(
-        "api/parcel/<int:town_id>/<str:loc_id>/geometry/",
-        views.parcel_geometry,
-        name="parcel_geometry",
-    ),
     path(
         "api/town-boundaries/",
         views.town_boundaries,
@@ -150,21 +167,6 @@ urlpatterns = [
         views.boston_neighborhoods,
         name="boston_neighborhoods",
     ),
-    path(
-        "api/parcels-in-viewport/",
-        views.parcels_in_viewport,
-        name="parcels_in_viewport",
-    ),
-    path(
-        "api/parcel-flags/",
-        views.parcel_flags,
-        name="parcel_flags",
-    ),
-    path(
-        "api/town-geojson/<int:town_id>/",
-        views.town_geojson,
-        name="town_geojson",
-    ),
     path("crm/", views.crm_overview, name="crm_overview"),
     path("crm/<slug:city_slug>/", views.crm_city_requests, name="crm_city_requests"),
     # CRM Lead Management
@@ -1,5 +1,6 @@
 import base64
 import csv
+import gzip
 import hashlib
 import json
 import logging
@@ -27,8 +28,10 @@ try:  # Stripe is optional; endpoints guard against missing dependency
 except ImportError:  # pragma: no cover - handled gracefully at runtime
     stripe = None
 
+import numpy as np
 import pandas as pd
 import requests
+import zstandard
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
@@ -92,7 +95,7 @@ from .attom_service import (
     update_attom_data_for_parcel,
 )
 from .background_lien_search import (
-    ensure_legal_action_record,
+    ensure_legal_action_records,
     search_parcel_background,
     should_search_parcel,
 )
@@ -4036,7 +4039,7 @@ def parcel_search_detail(request, town_id, loc_id, list_id=None):
 @login_required
 @require_POST
 def parcel_search_save_list(request):
-    from .attom_service import update_attom_data_for_parcel
+    from .attom_service import update_attom_data_for_parcels
     import threading
 
     form = ParcelListSaveForm(request.POST)
@@ -4081,16 +4084,11 @@ def parcel_search_save_list(request):
 
             saved_list = SavedParcelList.objects.get(pk=saved_list_id)
 
-            with ThreadPoolExecutor(max_workers=5) as executor:
-                futures = []
-                for loc_id in loc_ids:
-                    futures.append(executor.submit(update_attom_data_for_parcel, saved_list, town_id, loc_id))
-
-                for future in as_completed(futures):
-                    try:
-                        future.result()
-                    except Exception as e:
-                        logger.error(f"Error updating ATTOM data for parcel: {e}")
+            failed = update_attom_data_for_parcels(
+                saved_list, [(town_id, loc_id) for loc_id in loc_ids]
+            )
+            for failed_town_id, failed_loc_id in failed:
+                logger.error(f"Error updating ATTOM data for parcel {failed_town_id}/{failed_loc_id}")
 
             logger.info(f"Successfully enriched {len(loc_ids)} parcels with ATTOM data for list '{saved_list.name}'")
         except Exception as e:
@@ -5692,6 +5690,43 @@ def _normalize_cell(value):
     return value
 
 
+# Values at or above these round past PositiveSmallIntegerField / DecimalField(3, 1).
+_LEAD_BEDROOMS_LIMIT = Decimal("32767.5")
+_LEAD_BATHROOMS_LIMIT = Decimal("99.95")
+
+
+def _parse_decimal_cell(value) -> Optional[Decimal]:
+    try:
+        parsed = Decimal(str(value))
+    except InvalidOperation:
+        return None
+    return parsed if parsed.is_finite() else None
+
+
+def _coerce_bed_bath(lead_data: dict) -> None:
+    """
+    Fit imported bedroom/bathroom text to the Lead columns.
+
+    Spreadsheets are read as strings. Bedrooms are rounded to a whole count and
+    bathrooms to one decimal place, half up, the same way migration 0034 rounded
+    existing rows. Anything else the columns cannot hold is dropped instead of failing
+    the row (and with it the rest of the import).
+    """
+    if lead_data.get("bedrooms") is not None:
+        value = _parse_decimal_cell(lead_data["bedrooms"])
+        if value is not None and 0 <= value < _LEAD_BEDROOMS_LIMIT:
+            lead_data["bedrooms"] = int(value.to_integral_value(rounding=ROUND_HALF_UP))
+        else:
+            lead_data["bedrooms"] = None
+
+    if lead_data.get("bathrooms") is not None:
+        value = _parse_decimal_cell(lead_data["bathrooms"])
+        if value is not None and 0 <= value < _LEAD_BATHROOMS_LIMIT:
+            lead_data["bathrooms"] = value.quantize(Decimal("0.1"), rounding=ROUND_HALF_UP)
+        else:
+            lead_data["bathrooms"] = None
+
+
 # --- Excel import workflow for bulk lead ingestion.
 @login_required
 def lead_upload(request):
@@ -5767,6 +5802,7 @@ def lead_upload(request):
 
                     lead_data["status"] = lead_data.get("status") or "Cold"
                     lead_data["notes"] = lead_data.get("notes") or ""
+                    _coerce_bed_bath(lead_data)
 
                     meaningful_data = [
                         value
@@ -6121,8 +6157,10 @@ def parcel_unit_attom(request, town_id, loc_id):
 
     cache_key = build_attom_cache_key(normalized_loc, target_unit)
 
+    # Only the parsed columns are rendered here; leave the large raw JSON in the database.
     attom_data = (
-        AttomData.objects.filter(
+        AttomData.objects.defer("raw_response")
+        .filter(
             town_id=town_id,
             loc_id=cache_key,
             last_updated__gte=cache_cutoff,
@@ -6146,7 +6184,8 @@ def parcel_unit_attom(request, town_id, loc_id):
             return JsonResponse({"hasData": False}, status=200)
 
         attom_data = (
-            AttomData.objects.filter(
+            AttomData.objects.defer("raw_response")
+            .filter(
                 town_id=town_id,
                 loc_id=cache_key,
             )
@@ -7073,14 +7112,13 @@ def parcels_in_viewport(request):
                             # Get the outer ring (first ring)
                             outer_ring = coordinates[0]
                             # Convert from GeoJSON [lng, lat] to Leaflet [lat, lng]
-                            leaflet_geometry = [[coord[1], coord[0]] for coord in outer_ring]
+                            # with one column swap instead of a per-vertex loop.
+                            if outer_ring:
+                                latlngs = np.asarray(outer_ring, dtype=float)[:, 1::-1]
+                                leaflet_geometry = latlngs.tolist()
 
-                            # Calculate centroid
-                            if leaflet_geometry:
-                                sum_lat = sum(coord[0] for coord in leaflet_geometry)
-                                sum_lng = sum(coord[1] for coord in leaflet_geometry)
-                                centroid_lat = sum_lat / len(leaflet_geometry)
-                                centroid_lng = sum_lng / len(leaflet_geometry)
+                                # Calculate centroid
+                                centroid_lat, centroid_lng = latlngs.mean(axis=0).tolist()
 
                     # Create normalized parcel matching MA field structure (flat, not GeoJSON)
                     # NH GRANIT only provides geometry, parcel ID, address, and land use - no owner/value data
@@ -7345,7 +7383,7 @@ def parcel_flags(request):
     lien markers and automated search behavior.
     """
     from .models import LienRecord, LegalAction
-    from .background_lien_search import search_parcel_background, should_search_parcel
+    from .background_lien_search import search_parcel_background, should_search_parcels
 
     try:
         payload = json.loads(request.body.decode("utf-8"))
@@ -7448,12 +7486,15 @@ def parcel_flags(request):
 
     searches_queued = 0
     if auto_lien_search_enabled:
-        for parcel in normalized:
-            if parcel.get("property_category") != "Residential":
-                continue
+        residential = [parcel for parcel in normalized if parcel.get("property_category") == "Residential"]
+        needs_search = should_search_parcels(
+            request.user,
+            [(parcel["town_id"], parcel["loc_id"]) for parcel in residential],
+        )
+        for parcel in residential:
             town_id = parcel["town_id"]
             loc_id = parcel["loc_id"]
-            if not should_search_parcel(request.user, town_id, loc_id):
+            if not needs_search[(town_id, loc_id)]:
                 continue
             parcel_data = {
                 "owner_name": parcel.get("owner") or "",
@@ -7667,13 +7708,9 @@ def search_liens_legal_actions(request, town_id, loc_id):
     saved_actions = 0
     saved_liens = 0
     
-    updated_actions = 0
-    for action_data in legal_actions_found:
-        created, updated = ensure_legal_action_record(request.user, town_id, loc_id, action_data)
-        if created:
-            saved_actions += 1
-        elif updated:
-            updated_actions += 1
+    saved_actions, updated_actions = ensure_legal_action_records(
+        request.user, town_id, loc_id, legal_actions_found
+    )
     
     # Note: Liens from automated search are usually guidance, not actual data
     # Manual entry is typically required
@@ -7716,7 +7753,6 @@ def town_geojson(request, town_id):
     try:
         from .services import _get_massgis_town, BOSTON_TOWN_ID
         town = _get_massgis_town(town_id)
-        town_name_safe = town.name.replace(' ', '_').replace('/', '_')
 
         # Boston has 98k+ parcels (917MB GeoJSON) - too large for client-side loading
         # Return 404 to force frontend to use legacy API with server-side filtering
@@ -7730,34 +7766,52 @@ def town_geojson(request, town_id):
                 "fallback_api": f"/api/parcels-in-viewport/?town_id={town_id}",
             }, status=404)
 
-        # Try to serve pre-generated GeoJSON first (FAST PATH)
-        static_file_name = f"town_{town_id}_{town_name_safe}.geojson"
+        # Try to serve pre-generated GeoJSON first (FAST PATH). Files are gzip- or
+        # zstd-compressed; plain .geojson files from older runs are still honoured.
+        # zstd files are preferred for clients that accept them and otherwise only
+        # used as a last resort, decoded server-side. Files are named by town ID;
+        # the older town_{id}_{name} names are checked after the canonical ones.
+        town_name_safe = town.name.replace(' ', '_').replace('/', '_')
+        accepts_zstd = "zstd" in request.META.get("HTTP_ACCEPT_ENCODING", "")
+        static_file_names = []
+        for base_name in (f"town_{town_id}.geojson", f"town_{town_id}_{town_name_safe}.geojson"):
+            if accepts_zstd:
+                static_file_names.append(f"{base_name}.zst")
+            static_file_names.extend([f"{base_name}.gz", base_name])
+            if not accepts_zstd:
+                static_file_names.append(f"{base_name}.zst")
 
         # Check multiple possible locations
-        possible_paths = [
-            Path(settings.BASE_DIR) / "static" / "geojson" / "towns" / static_file_name,
-            Path(settings.STATIC_ROOT) / "geojson" / "towns" / static_file_name if settings.STATIC_ROOT else None,
+        search_dirs = [
+            Path(settings.BASE_DIR) / "static" / "geojson" / "towns",
+            Path(settings.STATIC_ROOT) / "geojson" / "towns" if settings.STATIC_ROOT else None,
         ]
 
-        for geojson_path in possible_paths:
-            if geojson_path and geojson_path.exists():
+        for search_dir in search_dirs:
+            if not search_dir:
+                continue
+            for static_file_name in static_file_names:
+                geojson_path = search_dir / static_file_name
+                if not geojson_path.exists():
+                    continue
                 logger.info(f"Serving pre-generated GeoJSON for {town.name} from {geojson_path}")
-
-                # Serve the static file with optimal caching headers
-                with open(geojson_path, 'r') as f:
-                    geojson_data = json.load(f)
-
-                response = JsonResponse(geojson_data, safe=False)
+                response = _static_geojson_response(request, geojson_path)
                 # Cache for 1 year (immutable data)
                 response['Cache-Control'] = 'public, max-age=31536000, immutable'
                 response['X-Served-From'] = 'static-geojson'
                 return response
 
-        # Attempt to serve from S3 (fastest path) if local files are unavailable
-        s3_response = _maybe_redirect_geojson_from_s3(static_file_name)
-        if s3_response:
-            logger.info(f"Redirecting GeoJSON request for {town.name} to S3")
-            return s3_response
+        # Attempt to serve from S3 (fastest path) if local files are unavailable.
+        # S3 serves objects with their stored Content-Encoding, so zstd objects are
+        # only offered to clients that can decode them.
+        for static_file_name in static_file_names:
+            if static_file_name.endswith(".zst") and not accepts_zstd:
+                continue
+            s3_response = _maybe_redirect_geojson_from_s3(static_file_name)
+            if s3_response:
+                logger.info(f"Redirecting GeoJSON request for {town.name} to S3")
+                s3_response["Vary"] = "Accept-Encoding"
+                return s3_response
 
         # SLOW PATH: GeoJSON not pre-generated, fall back to dynamic generation
         logger.warning(
@@ -7787,6 +7841,26 @@ def town_geojson(request, town_id):
         }, status=500)
 
 
+def _static_geojson_response(request, geojson_path: Path) -> HttpResponse:
+    """Return a pre-generated GeoJSON file, passing compressed bytes through when the client accepts them."""
+    content_encoding = {".gz": "gzip", ".zst": "zstd"}.get(geojson_path.suffix)
+    if content_encoding is None:
+        return HttpResponse(geojson_path.read_bytes(), content_type="application/geo+json")
+
+    if content_encoding in request.META.get("HTTP_ACCEPT_ENCODING", ""):
+        response = HttpResponse(geojson_path.read_bytes(), content_type="application/geo+json")
+        response["Content-Encoding"] = content_encoding
+        response["Vary"] = "Accept-Encoding"
+        return response
+
+    if content_encoding == "zstd":
+        with zstandard.open(geojson_path, "rb") as handle:
+            return HttpResponse(handle.read(), content_type="application/geo+json")
+
+    with gzip.open(geojson_path, "rb") as handle:
+        return HttpResponse(handle.read(), content_type="application/geo+json")
+
+
 def _maybe_redirect_geojson_from_s3(static_file_name: str) -> Optional[HttpResponseRedirect]:
     from django.conf import settings
 